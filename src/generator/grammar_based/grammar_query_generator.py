@@ -1,11 +1,14 @@
 import random
 import re
 from IPython.display import display
-from typing import Union, Set, List, Callable, Optional
+from typing import Union, Set, List, Callable, Optional, Dict, Tuple, FrozenSet
 
-from generator.grammar_based.utils.grammar import Grammar, Expansion, is_valid_grammar, is_nonterminal, exp_string, RE_NONTERMINAL, nonterminals, START_SYMBOL
+from generator.grammar_based.utils.grammar import Grammar, Expansion, is_valid_grammar, is_nonterminal, exp_string, RE_NONTERMINAL, nonterminals, reachable_nonterminals, START_SYMBOL
 from generator.grammar_based.utils.derivation_tree import DerivationTree, all_terminals, display_tree
 
+# Pieces of every expansion string seen so far, as (string, is nonterminal) pairs
+_EXPANSION_PIECES_CACHE: Dict[str, List[Tuple[str, bool]]] = {}
+
 def expansion_to_children(expansion: Expansion) -> List[DerivationTree]:
     # print("Converting " + repr(expansion))
     # strings contains all substrings -- both terminals and nonterminals such
@@ -17,9 +20,15 @@ def expansion_to_children(expansion: Expansion) -> List[DerivationTree]:
     if expansion == "":  # Special case: epsilon expansion
         return [("", [])]
 
-    strings = re.split(RE_NONTERMINAL, expansion)
-    return [(s, None) if is_nonterminal(s) else (s, [])
-            for s in strings if len(s) > 0]
+    pieces = _EXPANSION_PIECES_CACHE.get(expansion)
+    if pieces is None:
+        strings = re.split(RE_NONTERMINAL, expansion)
+        pieces = _EXPANSION_PIECES_CACHE[expansion] = [
+            (s, bool(is_nonterminal(s))) for s in strings if len(s) > 0]
+
+    # Fresh child tuples and lists each time: derivation trees are expanded in place
+    return [(s, None) if nonterminal else (s, [])
+            for s, nonterminal in pieces]
 
 
 class GrammarQueryGenerator:
@@ -44,6 +53,12 @@ class GrammarQueryGenerator:
         self.max_nonterminals = max_nonterminals
         self.disp = disp
         self.log = log
+
+        # Nonterminals reachable from each symbol (itself included), filled on demand by symbol_cost()
+        self._reachable_from: Dict[str, FrozenSet[str]] = {}
+        # Cost of each symbol given the seen symbols it can reach, filled on demand by symbol_cost()
+        self._symbol_cost_cache: Dict[Tuple[str, FrozenSet[str]], Union[int, float]] = {}
+
         self.check_grammar()  # Invokes is_valid_grammar()
 
     def fuzz_tree(self) -> DerivationTree:
@@ -128,11 +143,15 @@ class GrammarQueryGenerator:
         return sum(self.possible_expansions(c) for c in children)
     
     def any_possible_expansions(self, node: DerivationTree) -> bool:
-        (symbol, children) = node
-        if children is None:
-            return True
-
-        return any(self.any_possible_expansions(c) for c in children)
+        # Iterative search for an unexpanded node: no generator or call per subtree
+        stack = [node]
+        while stack:
+            (symbol, children) = stack.pop()
+            if children is None:
+                return True
+            stack.extend(children)
+
+        return False
     
     def choose_tree_expansion(self,
                               tree: DerivationTree,
@@ -149,14 +168,13 @@ class GrammarQueryGenerator:
             # Expand this node
             return self.expand_node(tree)
 
-        # Find all children with possible expansions
-        expandable_children = [
-            c for c in children if self.any_possible_expansions(c)]
-
         # `index_map` translates an index in `expandable_children`
         # back into the original index in `children`
         index_map = [i for (i, c) in enumerate(children)
-                     if c in expandable_children]
+                     if self.any_possible_expansions(c)]
+
+        # Find all children with possible expansions
+        expandable_children = [children[i] for i in index_map]
 
         # Select a random child
         child_to_be_expanded = \
@@ -170,8 +188,20 @@ class GrammarQueryGenerator:
     
     def symbol_cost(self, symbol: str, seen: Set[str] = set()) \
             -> Union[int, float]:
-        expansions = self.grammar[symbol]
-        return min(self.expansion_cost(e, seen | {symbol}) for e in expansions)
+        # Seen symbols that cannot occur below `symbol` do not change its cost, so
+        # leaving them out of the key keeps one entry per distinct outcome
+        # instead of one per recursion path
+        reachable = self._reachable_from.get(symbol)
+        if reachable is None:
+            reachable = self._reachable_from[symbol] = frozenset(
+                reachable_nonterminals(self.grammar, symbol))
+        cache_key = (symbol, reachable.intersection(seen))
+        cost = self._symbol_cost_cache.get(cache_key)
+        if cost is None:
+            expansions = self.grammar[symbol]
+            cost = min(self.expansion_cost(e, seen | {symbol}) for e in expansions)
+            self._symbol_cost_cache[cache_key] = cost
+        return cost
 
     def expansion_cost(self, expansion: Expansion,
                        seen: Set[str] = set()) -> Union[int, float]:
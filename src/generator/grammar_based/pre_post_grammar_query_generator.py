@@ -24,6 +24,9 @@ class PrePostGrammarQueryGenerator(GrammarQueryGenerator):
         super().__init__(grammar, **kwargs)
         self.replacement_attempts = replacement_attempts
 
+        # Whether a symbol has post-expansion functions, filled on demand by expand_tree_once()
+        self._has_post_functions: Dict[str, bool] = {}
+
     def supported_opts(self) -> Set[str]:
         return super().supported_opts() | {"pre", "post", "order"}
     
@@ -192,8 +195,13 @@ class PrePostGrammarQueryGenerator(GrammarQueryGenerator):
         new_tree: DerivationTree = super().expand_tree_once(tree)
 
         (symbol, children) = new_tree
-        if all([exp_post_expansion_function(expansion)
-                is None for expansion in self.grammar[symbol]]):
+        has_post_functions = self._has_post_functions.get(symbol)
+        if has_post_functions is None:
+            has_post_functions = self._has_post_functions[symbol] = not all(
+                [exp_post_expansion_function(expansion)
+                 is None for expansion in self.grammar[symbol]])
+
+        if not has_post_functions:
             # No constraints for this symbol
             return new_tree
 
@@ -11,18 +11,21 @@ DerivationTree = Tuple[str, Optional[List[Any]]]
 
 # Core functionality of the derivation tree
 def all_terminals(tree: DerivationTree) -> str:
-    (symbol, children) = tree
-    if children is None:
-        # This is a nonterminal symbol not expanded yet
-        return symbol
-
-    if len(children) == 0:
-        # This is a terminal symbol
-        return symbol
-
-    # This is an expanded symbol:
-    # Concatenate all terminal symbols from all children
-    return ''.join([all_terminals(c) for c in children])
+    # Collect the leaves from left to right and join them once,
+    # rather than building a string for every subtree
+    terminals = []
+    stack = [tree]
+    while stack:
+        (symbol, children) = stack.pop()
+        if not children:
+            # A nonterminal symbol not expanded yet (None),
+            # or a terminal symbol ([])
+            terminals.append(symbol)
+        else:
+            # An expanded symbol: visit its children in order
+            stack.extend(reversed(children))
+
+    return ''.join(terminals)
 
 def tree_to_string(tree: DerivationTree) -> str:
     symbol, children, *_ = tree
@@ -1,10 +1,9 @@
 import sys
 import random
 import re
-import copy
 import os
 import json
-from typing import Dict, Any, List, Tuple, Union, Optional, Set, Callable
+from typing import Dict, Any, List, Tuple, Union, Optional, Set, Callable, Iterator
 
 START_SYMBOL = "<start>"
 RE_NONTERMINAL = re.compile(r'(<[^<> ]*>)')
@@ -15,6 +14,12 @@ TABLE_CURRENTLY_USED = None
 
 SCHEMA_INFO = None
 
+# Names of the tables (not views) in SCHEMA_INFO, built once when the schema is loaded
+TABLE_NAMES = None
+
+# Per table, each non-empty list-valued category of SCHEMA_INFO as a tuple (what use_name picks from)
+TABLE_NAME_TUPLES = None
+
 def load_schema_info(schema_path: str = "databases/schema_info.json") -> Dict:
     """
     Load schema information from the JSON file.
@@ -25,7 +30,7 @@ def load_schema_info(schema_path: str = "databases/schema_info.json") -> Dict:
     Returns:
         Dictionary containing the schema information
     """
-    global SCHEMA_INFO
+    global SCHEMA_INFO, TABLE_NAMES, TABLE_NAME_TUPLES
     
     # Load schema from JSON file if not already loaded
     if SCHEMA_INFO is None:
@@ -34,6 +39,15 @@ def load_schema_info(schema_path: str = "databases/schema_info.json") -> Dict:
             
         with open(schema_path, 'r') as f:
             SCHEMA_INFO = json.load(f)
+        
+        # Filter out views (only use tables)
+        TABLE_NAMES = tuple(table_name for table_name, info in SCHEMA_INFO.items()
+                            if not info.get("is_view", False))
+        TABLE_NAME_TUPLES = {
+            table_name: {category: tuple(names) for category, names in info.items()
+                         if isinstance(names, list) and names}
+            for table_name, info in SCHEMA_INFO.items()
+        }
     
     return SCHEMA_INFO
 
@@ -46,15 +60,11 @@ def select_random_table() -> None:
     global TABLE_CURRENTLY_USED
     
     # Load schema if not already loaded
-    schema_info = load_schema_info()
-    
-    # Filter out views (only use tables)
-    tables = [table_name for table_name, info in schema_info.items() 
-              if not info.get("is_view", False)]
+    load_schema_info()
     
     # Select a random table
-    if tables:
-        TABLE_CURRENTLY_USED = random.choice(tables)
+    if TABLE_NAMES:
+        TABLE_CURRENTLY_USED = random.choice(TABLE_NAMES)
     else:
         raise ValueError("No tables found in schema JSON file")
     
@@ -73,28 +83,22 @@ def use_name(name_category: str) -> Union[None, str]:
     Returns:
         A randomly selected name from the specified category, or None if the category is empty
     """
-    global TABLE_CURRENTLY_USED
-    
     # Load schema if not already loaded
-    schema_info = load_schema_info()
+    if SCHEMA_INFO is None:
+        load_schema_info()
     
     # Ensure a table is selected
     if TABLE_CURRENTLY_USED is None:
         select_random_table()
     
-    # Get the table information
-    if TABLE_CURRENTLY_USED not in schema_info:
+    # Get the names of the table, by category
+    table_names = TABLE_NAME_TUPLES.get(TABLE_CURRENTLY_USED)
+    if table_names is None:
         raise ValueError(f"Table {TABLE_CURRENTLY_USED} not found in schema")
     
-    table_info = schema_info[TABLE_CURRENTLY_USED]
-    
     # Get names from the specified category
-    if name_category in table_info:
-        names = table_info[name_category]
-        if isinstance(names, list) and names:
-            return random.choice(names)
-    
-    return None
+    names = table_names.get(name_category)
+    return random.choice(names) if names else None
 
 
 Option = Dict[str, Any]
@@ -106,21 +110,36 @@ Expansion = Union[str, Tuple[str, Option]]
 Grammar = Dict[str, List[Expansion]]
 
 
+# Nonterminals of every expansion string seen so far (the grammar walks rescan the same strings)
+_NONTERMINALS_CACHE: Dict[str, List[str]] = {}
+
 def nonterminals(expansion):
-    if isinstance(expansion, tuple):
+    if type(expansion) is tuple:
         expansion = expansion[0]
 
-    return RE_NONTERMINAL.findall(expansion)
+    symbols = _NONTERMINALS_CACHE.get(expansion)
+    if symbols is None:
+        symbols = _NONTERMINALS_CACHE[expansion] = [sys.intern(symbol) for symbol in RE_NONTERMINAL.findall(expansion)]
+    return symbols
 
 def is_nonterminal(s):
     return RE_NONTERMINAL.match(s)
 
 def extend_grammar(grammar: Grammar, extension: Grammar = {}) -> Grammar:
     """Create a copy of `grammar`, updated with `extension`."""
-    new_grammar = copy.deepcopy(grammar)
+    # Expansion lists are copied; their strings and option dicts are never mutated in place
+    new_grammar = {symbol: list(expansions) for symbol, expansions in grammar.items()}
     new_grammar.update(extension)
     return new_grammar
 
+def intern_symbols(grammar: Grammar) -> Grammar:
+    """Return `grammar` with interned nonterminal names and expansion strings
+    (also inside `(expansion, opts)` pairs), so equal strings are one shared object."""
+    return {sys.intern(symbol): [sys.intern(expansion) if type(expansion) is str
+                                 else (sys.intern(expansion[0]), expansion[1])
+                                 for expansion in expansions]
+            for symbol, expansions in grammar.items()}
+
 def new_symbol(grammar: Grammar, symbol_name: str = "<symbol>") -> str:
     """Return a new symbol for `grammar` based on `symbol_name`"""
     if symbol_name not in grammar:
@@ -128,64 +147,81 @@ def new_symbol(grammar: Grammar, symbol_name: str = "<symbol>") -> str:
 
     count = 1
     while True:
-        tentative_symbol_name = symbol_name[:-1] + "-" + repr(count) + ">"
+        tentative_symbol_name = symbol_name[:-1] + "-" + str(count) + ">"
         if tentative_symbol_name not in grammar:
             return tentative_symbol_name
         count += 1
 
+def new_symbols(grammar: Grammar, symbol_name: str = "<symbol>") -> Iterator[str]:
+    """Yield the successive symbols `new_symbol` would return as each one is added to `grammar`.
+    The counter carries over between symbols instead of restarting at 1."""
+    if symbol_name not in grammar:
+        yield symbol_name
+
+    count = 1
+    while True:
+        tentative_symbol_name = symbol_name[:-1] + "-" + str(count) + ">"
+        if tentative_symbol_name not in grammar:
+            yield tentative_symbol_name
+        count += 1
+
 def parenthesized_expressions(expansion: Expansion) -> List[str]:
-    if isinstance(expansion, tuple):
+    if type(expansion) is tuple:
         expansion = expansion[0]
 
-    return re.findall(RE_PARENTHESIZED_EXPR, expansion)
+    return RE_PARENTHESIZED_EXPR.findall(expansion)
 
 def extended_nonterminals(expansion: Expansion) -> List[str]:
-    if isinstance(expansion, tuple):
+    if type(expansion) is tuple:
         expansion = expansion[0]
 
-    return re.findall(RE_EXTENDED_NONTERMINAL, expansion)
+    return RE_EXTENDED_NONTERMINAL.findall(expansion)
 
 def convert_ebnf_parentheses(ebnf_grammar: Grammar) -> Grammar:
     """Convert a grammar in extended BNF to BNF"""
     grammar = extend_grammar(ebnf_grammar)
-    for nonterminal in ebnf_grammar:
-        expansions = ebnf_grammar[nonterminal]
-
-        for i in range(len(expansions)):
-            expansion = expansions[i]
-            if not isinstance(expansion, str):
-                expansion = expansion[0]
-
-            while True:
-                parenthesized_exprs = parenthesized_expressions(expansion)
-                if len(parenthesized_exprs) == 0:
-                    break
-
-                for expr in parenthesized_exprs:
-                    operator = expr[-1:]
-                    contents = expr[1:-2]
+    symbols = new_symbols(grammar)
 
-                    new_sym = new_symbol(grammar)
+    def replace_parenthesized_expr(match):
+        expr = match.group(0)
+        operator = expr[-1:]
+        contents = expr[1:-2]
 
-                    exp = grammar[nonterminal][i]
-                    opts = None
-                    if isinstance(exp, tuple):
-                        (exp, opts) = exp
-                    assert isinstance(exp, str)
+        new_sym = next(symbols)
+        grammar[new_sym] = [contents]
+        return new_sym + operator
 
-                    expansion = exp.replace(expr, new_sym + operator, 1)
-                    if opts:
-                        grammar[nonterminal][i] = (expansion, opts)
-                    else:
-                        grammar[nonterminal][i] = expansion
+    for nonterminal in ebnf_grammar:
+        expansions = grammar[nonterminal]
 
-                    grammar[new_sym] = [contents]
+        for i in range(len(expansions)):
+            exp = expansions[i]
+            opts = None
+            if isinstance(exp, tuple):
+                (exp, opts) = exp
+            assert isinstance(exp, str)
+
+            # Each pass rewrites every innermost group in one go, exposing the groups around them
+            expansion, replaced = RE_PARENTHESIZED_EXPR.subn(replace_parenthesized_expr, exp)
+            if not replaced:
+                continue
+            while replaced:
+                expansion, replaced = RE_PARENTHESIZED_EXPR.subn(replace_parenthesized_expr, expansion)
+
+            if opts:
+                expansions[i] = (expansion, opts)
+            else:
+                expansions[i] = expansion
 
     return grammar
 
 def convert_ebnf_operators(ebnf_grammar: Grammar) -> Grammar:
     """Convert a grammar in extended BNF to BNF"""
     grammar = extend_grammar(ebnf_grammar)
+
+    # One running symbol counter per base symbol, so no search restarts at <base-1>
+    symbols_by_base = {}
+
     for nonterminal in ebnf_grammar:
         expansions = ebnf_grammar[nonterminal]
 
@@ -199,7 +235,10 @@ def convert_ebnf_operators(ebnf_grammar: Grammar) -> Grammar:
                 assert original_symbol in ebnf_grammar, \
                     f"{original_symbol} is not defined in grammar"
 
-                new_sym = new_symbol(grammar, original_symbol)
+                symbols = symbols_by_base.get(original_symbol)
+                if symbols is None:
+                    symbols = symbols_by_base[original_symbol] = new_symbols(grammar, original_symbol)
+                new_sym = next(symbols)
 
                 exp = grammar[nonterminal][i]
                 opts = None
@@ -231,13 +270,13 @@ def opts(**kwargs: Any) -> Dict[str, Any]:
 
 def exp_string(expansion: Expansion) -> str:
     """Return the string to be expanded"""
-    if isinstance(expansion, str):
+    if type(expansion) is str:
         return expansion
     return expansion[0]
 
 def exp_opts(expansion: Expansion) -> Dict[str, Any]:
     """Return the options of an expansion.  If options are not defined, return {}"""
-    if isinstance(expansion, str):
+    if type(expansion) is str:
         return {}
     return expansion[1]
 
@@ -258,8 +297,8 @@ def set_opts(grammar: Grammar, symbol: str, expansion: Expansion,
         if opts == {} or new_opts == {}:
             new_opts = opts
         else:
-            for key in opts:
-                new_opts[key] = opts[key]
+            # Build a fresh dict: the old one may be shared with copies of this grammar
+            new_opts = {**new_opts, **opts}
 
         if new_opts == {}:
             grammar[symbol][i] = exp_string(exp)
@@ -281,12 +320,11 @@ def def_used_nonterminals(grammar: Grammar, start_symbol:
     """Return a pair (`defined_nonterminals`, `used_nonterminals`) in `grammar`.
     In case of error, return (`None`, `None`)."""
 
-    defined_nonterminals = set()
+    defined_nonterminals = set(grammar)
     used_nonterminals = {start_symbol}
+    add_used_nonterminals = used_nonterminals.update
 
-    for defined_nonterminal in grammar:
-        defined_nonterminals.add(defined_nonterminal)
-        expansions = grammar[defined_nonterminal]
+    for defined_nonterminal, expansions in grammar.items():
         if not isinstance(expansions, list):
             print(repr(defined_nonterminal) + ": expansion is not a list",
                   file=sys.stderr)
@@ -298,7 +336,7 @@ def def_used_nonterminals(grammar: Grammar, start_symbol:
             return None, None
 
         for expansion in expansions:
-            if isinstance(expansion, tuple):
+            if type(expansion) is tuple:
                 expansion = expansion[0]
             if not isinstance(expansion, str):
                 print(repr(defined_nonterminal) + ": "
@@ -306,35 +344,37 @@ def def_used_nonterminals(grammar: Grammar, start_symbol:
                       file=sys.stderr)
                 return None, None
 
-            for used_nonterminal in nonterminals(expansion):
-                used_nonterminals.add(used_nonterminal)
+            add_used_nonterminals(nonterminals(expansion))
 
     return defined_nonterminals, used_nonterminals
 
 def reachable_nonterminals(grammar: Grammar,
                            start_symbol: str = START_SYMBOL) -> Set[str]:
-    reachable = set()
-
-    def _find_reachable_nonterminals(grammar, symbol):
-        nonlocal reachable
-        reachable.add(symbol)
+    # Iterative worklist: deep grammars cannot hit the recursion limit
+    reachable = {start_symbol}
+    stack = [start_symbol]
+    while stack:
+        symbol = stack.pop()
         for expansion in grammar.get(symbol, []):
             for nonterminal in nonterminals(expansion):
                 if nonterminal not in reachable:
-                    _find_reachable_nonterminals(grammar, nonterminal)
+                    reachable.add(nonterminal)
+                    stack.append(nonterminal)
 
-    _find_reachable_nonterminals(grammar, start_symbol)
     return reachable
 
 def unreachable_nonterminals(grammar: Grammar,
                              start_symbol=START_SYMBOL) -> Set[str]:
-    return grammar.keys() - reachable_nonterminals(grammar, start_symbol)
+    reachable = reachable_nonterminals(grammar, start_symbol)
+    return {symbol for symbol in grammar if symbol not in reachable}
 
 def opts_used(grammar: Grammar) -> Set[str]:
     used_opts = set()
-    for symbol in grammar:
-        for expansion in grammar[symbol]:
-            used_opts |= set(exp_opts(expansion).keys())
+    for expansions in grammar.values():
+        for expansion in expansions:
+            # Inlined exp_opts(): plain strings have no options
+            if type(expansion) is not str:
+                used_opts.update(expansion[1])
     return used_opts
 
 def is_valid_grammar(grammar: Grammar,
@@ -362,14 +402,15 @@ def is_valid_grammar(grammar: Grammar,
               file=sys.stderr)
 
     # Symbols must be reachable either from <start> or given start symbol
-    unreachable = unreachable_nonterminals(grammar, start_symbol)
+    # (one traversal per distinct start symbol)
+    reachable = reachable_nonterminals(grammar, start_symbol)
     msg_start_symbol = start_symbol
 
-    if START_SYMBOL in grammar:
-        unreachable = unreachable - \
-            reachable_nonterminals(grammar, START_SYMBOL)
-        if start_symbol != START_SYMBOL:
-            msg_start_symbol += " or " + START_SYMBOL
+    if START_SYMBOL in grammar and start_symbol != START_SYMBOL:
+        reachable |= reachable_nonterminals(grammar, START_SYMBOL)
+        msg_start_symbol += " or " + START_SYMBOL
+
+    unreachable = [symbol for symbol in grammar if symbol not in reachable]
 
     for unreachable_nonterminal in unreachable:
         print(repr(unreachable_nonterminal) + ": unreachable from " + msg_start_symbol + ". Consider applying trim_grammar() on the grammar",
@@ -2017,6 +2058,8 @@ SQL_GRAMMAR: Grammar = {
   ],
 }
 
+SQL_GRAMMAR = intern_symbols(SQL_GRAMMAR)
+
 # BNF_SQL_GRAMMAR = convert_ebnf_grammar(SQL_GRAMMAR) produced:
 
 BNF_SQL_GRAMMAR = {
@@ -3197,7 +3240,9 @@ BNF_SQL_GRAMMAR = {
     "<asc_desc-5>": ["", "<asc_desc>"],
 }
 
-USE_NAMES_BNF_SQL_GRAMMAR = extend_grammar(BNF_SQL_GRAMMAR,
+BNF_SQL_GRAMMAR = intern_symbols(BNF_SQL_GRAMMAR)
+
+USE_NAMES_BNF_SQL_GRAMMAR = intern_symbols(extend_grammar(BNF_SQL_GRAMMAR,
   {
       # Only do one statement
       "<sql_stmt_list>": ["<sql_stmt> <SCOL>"], # Was "<sql_stmt> <symbol-116> <SCOL>"
@@ -3776,4 +3821,4 @@ USE_NAMES_BNF_SQL_GRAMMAR = extend_grammar(BNF_SQL_GRAMMAR,
       #     )
       # ]
   }
-)
+))
@@ -7,6 +7,18 @@ import json
 import re
 from typing import List, Dict
 
+# Catalog queries shared by data generation and the schema extraction/verification helpers
+_TABLE_NAMES_SQL = "SELECT name FROM sqlite_master WHERE type='table'"
+_VIEW_NAMES_SQL = "SELECT name FROM sqlite_master WHERE type='view'"
+
+# The generated databases are rebuilt on every run, so durability is not worth any fsyncs
+_THROWAWAY_DB_PRAGMAS = """
+    PRAGMA synchronous = OFF;
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA locking_mode = EXCLUSIVE;
+    PRAGMA temp_store = MEMORY;
+"""
+
 class DBGenerator:
     """
     Class to generate SQLite databases with IDENTICAL schema but different data.
@@ -53,16 +65,21 @@ class DBGenerator:
         schema_definition = self._generate_random_schema()
         
         # STEP 2: Create each database using the SAME schema but different data
-        for db_name, size in db_configs:
-            db_path = os.path.join(self.db_dir, db_name)
-            
-            # Create database with the common schema
-            self._create_database_with_schema(db_path, schema_definition, size)
-            db_paths.append(db_path)
-            
-            # Create a backup copy
-            backup_path = os.path.join(self.db_dir, f"{os.path.splitext(db_name)[0]}_copy.db")
-            shutil.copy2(db_path, backup_path)
+        # The schema DDL runs once; every database starts as a page copy of it
+        schema_template = self._create_schema_template(schema_definition)
+        try:
+            for db_name, size in db_configs:
+                db_path = os.path.join(self.db_dir, db_name)
+                
+                # Create database with the common schema
+                self._create_database_with_schema(db_path, schema_template, size)
+                db_paths.append(db_path)
+                
+                # Create a backup copy
+                backup_path = os.path.join(self.db_dir, f"{os.path.splitext(db_name)[0]}_copy.db")
+                shutil.copy2(db_path, backup_path)
+        finally:
+            schema_template.close()
         
         # STEP 3: Generate schema JSON based on the first database
         schema_json_path = os.path.join(self.db_dir, "schema_info.json")
@@ -139,56 +156,82 @@ class DBGenerator:
         
         return tables
     
-    def _create_database_with_schema(self, db_path: str, schema: List[Dict], size: str) -> None:
+    def _create_schema_template(self, schema: List[Dict]) -> sqlite3.Connection:
+        """
+        Create an empty in-memory database with the predefined schema.
+        
+        Args:
+            schema: Schema definition (list of table definitions)
+            
+        Returns:
+            Connection to the schema-only database
+        """
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        
+        # Create tables, indices, and views
+        for table_def in schema:
+            table_name = table_def["name"]
+            
+            # Create table
+            column_defs = []
+            for col in table_def["columns"]:
+                col_def = f"{col['name']} {col['type']}"
+                if col["primary_key"]:
+                    col_def += " PRIMARY KEY"
+                column_defs.append(col_def)
+            
+            create_table_sql = f"CREATE TABLE {table_name} ({', '.join(column_defs)})"
+            cursor.execute(create_table_sql)
+            
+            # Create indices
+            for idx in table_def["indices"]:
+                index_name = idx["name"]
+                column_name = idx["column"]
+                cursor.execute(f"CREATE INDEX {index_name} ON {table_name}({column_name})")
+            
+            # Create view if present
+            if table_def["view"]:
+                view_name = table_def["view"]["name"]
+                view_columns = table_def["view"]["columns"]
+                columns_str = ", ".join(view_columns)
+                cursor.execute(f"CREATE VIEW {view_name} AS SELECT {columns_str} FROM {table_name}")
+        
+        cursor.execute("COMMIT")
+        return conn
+    
+    def _create_database_with_schema(self, db_path: str, schema_template: sqlite3.Connection, size: str) -> None:
         """
         Create a database with the predefined schema and fill it with data.
         
         Args:
             db_path: Path to create the database
-            schema: Schema definition (list of table definitions)
+            schema_template: Schema-only database from _create_schema_template
             size: Size of data to generate
         """
-        # Remove existing file if present
-        if os.path.exists(db_path):
-            os.remove(db_path)
-        
-        # Create new database
-        conn = sqlite3.connect(db_path)
+        # Build the database in memory (no journal or fsyncs), starting from a copy of the schema
+        conn = sqlite3.connect(":memory:", isolation_level=None)
         try:
-            cursor = conn.cursor()
+            schema_template.backup(conn)
             
-            # Create tables, indices, and views
-            for table_def in schema:
-                table_name = table_def["name"]
-                
-                # Create table
-                column_defs = []
-                for col in table_def["columns"]:
-                    col_def = f"{col['name']} {col['type']}"
-                    if col["primary_key"]:
-                        col_def += " PRIMARY KEY"
-                    column_defs.append(col_def)
-                
-                create_table_sql = f"CREATE TABLE {table_name} ({', '.join(column_defs)})"
-                cursor.execute(create_table_sql)
-                
-                # Create indices
-                for idx in table_def["indices"]:
-                    index_name = idx["name"]
-                    column_name = idx["column"]
-                    cursor.execute(f"CREATE INDEX {index_name} ON {table_name}({column_name})")
-                
-                # Create view if present
-                if table_def["view"]:
-                    view_name = table_def["view"]["name"]
-                    view_columns = table_def["view"]["columns"]
-                    columns_str = ", ".join(view_columns)
-                    cursor.execute(f"CREATE VIEW {view_name} AS SELECT {columns_str} FROM {table_name}")
+            # Fill the data in a single transaction (committed by _generate_data)
+            conn.execute("BEGIN")
+            self._generate_data(conn, size)
             
-            conn.commit()
+            # Remove existing file if present
+            try:
+                os.remove(db_path)
+            except FileNotFoundError:
+                pass
             
-            # Generate data
-            self._generate_data(conn, size)
+            # Write the finished database to disk in one pass
+            disk_conn = sqlite3.connect(db_path)
+            try:
+                disk_conn.executescript(_THROWAWAY_DB_PRAGMAS)
+                conn.backup(disk_conn)
+            finally:
+                disk_conn.close()
         
         finally:
             conn.close()
@@ -205,7 +248,7 @@ class DBGenerator:
         rows_per_table = 50 if size == "small" else 20
         
         # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        cursor.execute(_TABLE_NAMES_SQL)
         tables = [row[0] for row in cursor.fetchall()]
         
         for table_name in tables:
@@ -220,6 +263,10 @@ class DBGenerator:
                 columns.append(col_name)
                 column_types[col_name] = col_type
             
+            # Build the INSERT once per table so every row reuses the connection's prepared statement
+            placeholders = ', '.join(['?' for _ in columns])
+            insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+            
             # Insert random data
             for _ in range(rows_per_table):
                 values = []
@@ -236,11 +283,7 @@ class DBGenerator:
                 
                 # Insert data
                 try:
-                    placeholders = ', '.join(['?' for _ in columns])
-                    cursor.execute(
-                        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})",
-                        values
-                    )
+                    cursor.execute(insert_sql, values)
                 except sqlite3.Error:
                     # Skip on error (constraint violations, etc.)
                     pass
@@ -264,7 +307,7 @@ class DBGenerator:
         cursor = conn.cursor()
         
         # Get table names
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        cursor.execute(_TABLE_NAMES_SQL)
         tables = [row[0] for row in cursor.fetchall()]
         
         # Process each table
@@ -297,7 +340,7 @@ class DBGenerator:
             }
         
         # Process views
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
+        cursor.execute(_VIEW_NAMES_SQL)
         views = [row[0] for row in cursor.fetchall()]
         
         for view_name in views:
@@ -407,7 +450,7 @@ class DBGenerator:
         cursor = conn.cursor()
         
         # Check each table
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        cursor.execute(_TABLE_NAMES_SQL)
         db_tables = [row[0] for row in cursor.fetchall()]
         
         for table_name in db_tables:
@@ -465,7 +508,7 @@ class DBGenerator:
                     print(f"Extra in JSON: {extra}")
         
         # Check views
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
+        cursor.execute(_VIEW_NAMES_SQL)
         db_views = [row[0] for row in cursor.fetchall()]
         
         for view_name in db_views:
@@ -1,358 +1,109 @@
 import json
 import os
 import random
-from typing import List, Dict, Any
+import re
+import sys
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
-class SchemaQueryGenerator:
+def _compact_sql(sql: str) -> str:
+    """Collapse all whitespace runs of a query template into single spaces."""
+    return " ".join(sql.split())
+
+# A CTE definition inside a WITH clause: name, optional column list, optional hint, opening paren
+_CTE_DEFINITION_RE = re.compile(
+    r'(?:\bWITH(?:\s+RECURSIVE)?|,)\s*(\w+)(?:\s*\([^()]*\))?\s+AS\s+'
+    r'((?:NOT\s+)?MATERIALIZED\s+)?\(',
+    re.IGNORECASE,
+)
+
+# CTE bodies whose result is worth materializing even when read only once
+_AGGREGATING_CTE_RE = re.compile(r'GROUP\s+BY|\b(?:COUNT|AVG|SUM)\s*\(', re.IGNORECASE)
+
+def _annotate_cte_materialization(sql: str) -> str:
     """
-    Enhanced class to generate SQL queries covering most SQL features.
+    Add a MATERIALIZED / NOT MATERIALIZED hint to every non-recursive CTE
+    written without one, the way SQLite and DuckDB would choose it: CTEs read
+    more than once, or that aggregate, are materialized and everything else is
+    inlined. Hand-written hints are kept as they are.
     """
-    
-    def __init__(self, schema_path: str = "databases/schema_info.json"):
-        """
-        Initialize the query generator.
-        
-        Args:
-            schema_path: Path to the schema JSON file
-        """
-        self.schema_info = self._load_schema(schema_path)
-        self.table_names = [name for name, info in self.schema_info.items() 
-                           if not info.get("is_view", False)]
-        self.view_names = [name for name, info in self.schema_info.items() 
-                          if info.get("is_view", False)]
-        
-        if not self.table_names:
-            raise ValueError("No tables found in schema information.")
-    
-    def _load_schema(self, schema_path: str) -> Dict[str, Any]:
-        """
-        Load schema information from JSON file.
-        
-        Args:
-            schema_path: Path to the schema JSON file
-            
-        Returns:
-            Dictionary with schema information
-        """
-        if not os.path.exists(schema_path):
-            raise FileNotFoundError(f"Schema file {schema_path} not found.")
-            
-        with open(schema_path, 'r') as f:
-            schema_info = json.load(f)
-        
-        return schema_info
-    
-    def _get_random_table(self) -> str:
-        """Get a random table name from the schema."""
-        return random.choice(self.table_names)
-    
-    def _get_random_view(self) -> str:
-        """Get a random view name from the schema."""
-        if not self.view_names:
-            return None
-        return random.choice(self.view_names)
-    
-    def _get_random_tables(self, count: int = 2) -> List[str]:
-        """Get multiple random table names from the schema."""
-        if count >= len(self.table_names):
-            return self.table_names.copy()
-        return random.sample(self.table_names, count)
-    
-    def _get_random_column(self, table_name: str) -> str:
-        """Get a random column name from the specified table."""
-        if table_name not in self.schema_info:
-            raise ValueError(f"Table {table_name} not found in schema.")
-            
-        return random.choice(self.schema_info[table_name]["column_names"])
-    
-    def _get_random_columns(self, table_name: str, min_count: int = 1, max_count: int = None) -> List[str]:
-        """Get random column names from the specified table."""
-        if table_name not in self.schema_info:
-            raise ValueError(f"Table {table_name} not found in schema.")
-            
-        columns = self.schema_info[table_name]["column_names"]
-        
-        if max_count is None or max_count > len(columns):
-            max_count = len(columns)
-            
-        count = random.randint(min_count, max_count)
-        return random.sample(columns, count)
-    
-    def _get_primary_key_column(self, table_name: str) -> str:
-        """Get the primary key column of the specified table."""
-        if table_name not in self.schema_info:
-            raise ValueError(f"Table {table_name} not found in schema.")
-            
-        # Assuming c0 is always the primary key
-        return "c0"
-    
-    def _get_random_index(self, table_name: str) -> str:
-        """Get a random index name from the specified table."""
-        if table_name not in self.schema_info:
-            raise ValueError(f"Table {table_name} not found in schema.")
-            
-        indices = self.schema_info[table_name]["index_names"]
-        if not indices:
-            return None
-            
-        return random.choice(indices)
-    
-    def _get_column_type(self, table_name: str, column_name: str) -> str:
-        """Get the data type of a column."""
-        if table_name not in self.schema_info:
-            raise ValueError(f"Table {table_name} not found in schema.")
-            
-        if column_name not in self.schema_info[table_name]["column_types"]:
-            raise ValueError(f"Column {column_name} not found in table {table_name}.")
-            
-        return self.schema_info[table_name]["column_types"][column_name]
-    
-    def _is_numeric_column(self, table_name: str, column_name: str) -> bool:
-        """Check if the column is numeric."""
-        col_type = self._get_column_type(table_name, column_name)
-        numeric_types = ["INTEGER", "INT", "TINYINT", "SMALLINT", "MEDIUMINT", "BIGINT", 
-                         "UNSIGNED BIG INT", "INT2", "INT8", "REAL", "DOUBLE", 
-                         "DOUBLE PRECISION", "FLOAT", "NUMERIC", "DECIMAL"]
-        
-        return any(num_type in col_type.upper() for num_type in numeric_types)
-    
-    def _is_text_column(self, table_name: str, column_name: str) -> bool:
-        """Check if the column is text."""
-        col_type = self._get_column_type(table_name, column_name)
-        text_types = ["TEXT", "CHARACTER", "VARCHAR", "VARYING CHARACTER", 
-                     "NCHAR", "NATIVE CHARACTER", "NVARCHAR", "CLOB"]
-        
-        return any(text_type in col_type.upper() for text_type in text_types)
-    
-    def _is_date_column(self, table_name: str, column_name: str) -> bool:
-        """Check if the column is a date or datetime."""
-        col_type = self._get_column_type(table_name, column_name)
-        return "DATE" in col_type.upper()
-    
-    def _get_literal_for_column(self, table_name: str, column_name: str) -> str:
-        """Get a literal value appropriate for the column's data type."""
-        col_type = self._get_column_type(table_name, column_name)
-        
-        # Integer types
-        if any(int_type in col_type.upper() for int_type in ["INTEGER", "INT", "TINYINT", "SMALLINT", "MEDIUMINT", "BIGINT"]):
-            return str(random.randint(1, 100))
-        
-        # Float types
-        elif any(float_type in col_type.upper() for float_type in ["REAL", "DOUBLE", "FLOAT", "NUMERIC", "DECIMAL"]):
-            return str(round(random.uniform(1.0, 100.0), 2))
-        
-        # Text types
-        elif any(text_type in col_type.upper() for text_type in ["TEXT", "CHARACTER", "VARCHAR", "VARYING CHARACTER", "NCHAR", "CLOB"]):
-            return f"'Example{random.randint(1, 100)}'"
-        
-        # Boolean
-        elif "BOOLEAN" in col_type.upper():
-            return random.choice(["0", "1"])
-        
-        # Date
-        elif "DATE" in col_type.upper() and "TIME" not in col_type.upper():
-            return f"'2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}'"
-        
-        # DateTime
-        elif "DATETIME" in col_type.upper():
-            return f"'2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:{random.randint(0, 59):02d}:{random.randint(0, 59):02d}'"
-        
-        # Default
+    parts = []
+    last = 0
+    for match in _CTE_DEFINITION_RE.finditer(sql):
+        if match.group(2):
+            continue # Hint written by hand, keep it
+        
+        # Find the end of the CTE body by matching parentheses
+        body_start = match.end()
+        depth = 1
+        pos = body_start
+        while depth and pos < len(sql):
+            if sql[pos] == "(":
+                depth += 1
+            elif sql[pos] == ")":
+                depth -= 1
+            pos += 1
+        body = sql[body_start:pos - 1]
+        
+        # Table references only: qualified column names (name.col) are not counted
+        name_re = re.compile(rf'\b{re.escape(match.group(1))}\b(?!\s*\.)')
+        if name_re.search(body):
+            continue # Recursive CTE, keep the hint as written
+        references = len(name_re.findall(sql, pos))
+        
+        if references > 1 or _AGGREGATING_CTE_RE.search(body):
+            hint = "MATERIALIZED "
         else:
-            return "'example'"
-    
-    def generate_queries(self) -> List[str]:
-        """
-        Generate SQL queries covering most SQL features.
-        
-        Returns:
-            List of valid SQL queries
-        """
-        queries = ["SELECT 1;"] # Add dummy query to ensure that the energy assertion in the schedule class will not fail (division by zero because of empty seed)
-        
-        # Add queries for each category
-        queries.extend(self._generate_select_queries())
-        queries.extend(self._generate_join_queries())
-        queries.extend(self._generate_aggregate_queries())
-        queries.extend(self._generate_subquery_queries())
-        queries.extend(self._generate_insert_queries())
-        queries.extend(self._generate_update_queries())
-        queries.extend(self._generate_delete_queries())
-        queries.extend(self._generate_order_limit_queries())
-        queries.extend(self._generate_case_queries())
-        queries.extend(self._generate_union_queries())
-        queries.extend(self._generate_view_queries())
-        queries.extend(self._generate_index_queries())
-        queries.extend(self._generate_transaction_queries())
-        queries.extend(self._generate_cte_queries())
-        queries.extend(self._generate_function_queries())
-        queries.extend(self._generate_window_function_queries())
-        queries.extend(self._generate_schema_queries())
-        queries.extend(self._generate_materialized_queries())
-        queries.extend(self._generate_nested_queries())
-        
-        return queries
-    
-    def _generate_select_queries(self) -> List[str]:
-        """Generate basic SELECT queries."""
-        queries = []
-        
-        # Basic SELECT queries
-        for _ in range(3):
-            table = self._get_random_table()
-            # SELECT *
-            queries.append(f"SELECT * FROM {table};")
-            
-            # SELECT specific columns
-            columns = self._get_random_columns(table, min_count=2, max_count=4)
-            columns_str = ", ".join(columns)
-            queries.append(f"SELECT {columns_str} FROM {table};")
-            
-            # SELECT with WHERE
-            column = self._get_random_column(table)
-            if self._is_numeric_column(table, column):
-                queries.append(f"SELECT * FROM {table} WHERE {column} > {random.randint(1, 50)};")
-            elif self._is_text_column(table, column):
-                queries.append(f"SELECT * FROM {table} WHERE {column} LIKE 'A%';")
-            else:
-                queries.append(f"SELECT * FROM {table} WHERE {column} IS NOT NULL;")
-            
-            # SELECT with WHERE conditions
-            column1 = self._get_random_column(table)
-            column2 = self._get_random_column(table)
-            if column1 != column2:
-                queries.append(f"SELECT * FROM {table} WHERE {column1} IS NOT NULL AND {column2} IS NOT NULL;")
-                queries.append(f"SELECT * FROM {table} WHERE {column1} IS NULL OR {column2} IS NULL;")
-            
-            # SELECT DISTINCT
-            column = self._get_random_column(table)
-            queries.append(f"SELECT DISTINCT {column} FROM {table};")
+            hint = "NOT MATERIALIZED "
         
-        return queries
+        parts.append(sql[last:body_start - 1])
+        parts.append(hint)
+        last = body_start - 1
     
-    def _generate_join_queries(self) -> List[str]:
-        """Generate JOIN queries, including complex and unusual join patterns."""
-        queries = []
-        
-        # Make sure we have at least 2 tables
-        if len(self.table_names) < 2:
-            return queries
-        
-        # --- Standard JOIN queries  ---
-        for _ in range(3):
-            # Get two random tables
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            
-            # Basic INNER JOIN
-            queries.append(f"SELECT {table1}.{pk1}, {table2}.{pk2} FROM {table1} JOIN {table2} ON {table1}.{pk1} = {table2}.{pk2};")
-            
-            # LEFT JOIN
-            queries.append(f"SELECT * FROM {table1} LEFT JOIN {table2};")
-            queries.append(f"SELECT {table1}.{pk1}, {table2}.{pk2} FROM {table1} LEFT JOIN {table2} ON {table1}.{pk1} = {table2}.{pk2};")
-            
-            # Complex JOIN with table aliases
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            queries.append(f"SELECT a.{pk1}, a.{col1}, b.{pk2}, b.{col2} FROM {table1} a JOIN {table2} b ON a.{pk1} = b.{pk2};")
-        
-        # If we have 3 or more tables
-        if len(self.table_names) >= 3:
-            # Get three random tables
-            table1, table2, table3 = self._get_random_tables(3)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            pk3 = self._get_primary_key_column(table3)
-            
-            # Complex multi-table JOIN
-            queries.append(f"""
+    parts.append(sql[last:])
+    return "".join(parts)
+
+# Query templates are compacted to one line at import, so no per-call whitespace is emitted
+
+# Query templates for the multi-line JOIN patterns in _generate_join_queries
+_MULTI_TABLE_JOIN_TEMPLATE = _compact_sql("""
                 SELECT a.{pk1}, b.{pk2}, c.{pk3} 
                 FROM {table1} a 
                 JOIN {table2} b ON a.{pk1} = b.{pk2} 
                 JOIN {table3} c ON b.{pk2} = c.{pk3};
             """)
-            
-            # Multi-table JOIN with different join types
-            queries.append(f"""
+
+_MIXED_MULTI_TABLE_JOIN_TEMPLATE = _compact_sql("""
                 SELECT a.{pk1}, b.{pk2}, c.{pk3} 
                 FROM {table1} a 
                 LEFT JOIN {table2} b ON a.{pk1} = b.{pk2} 
                 INNER JOIN {table3} c ON b.{pk2} = c.{pk3};
             """)
-        
-        # Self JOIN
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        queries.append(f"SELECT a.{pk}, b.{pk} FROM {table} a, {table} b WHERE a.{pk} < b.{pk} AND a.{col} = b.{col};")
-        
-        # Cross JOIN
-        table1, table2 = self._get_random_tables(2)
-        queries.append(f"SELECT * FROM {table1} CROSS JOIN {table2};")
-        
-        # --- More complex JOIN queries ---
-        # Weird chained JOIN pattern
-        if len(self.table_names) >= 3:
-            table1, table2, table3 = self._get_random_tables(3)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            pk3 = self._get_primary_key_column(table3)
-            col1 = self._get_random_column(table1)
-            
-            # Chained JOIN with mixed types and no explicit ON clause for the last join
-            queries.append(f"""
+
+_CHAINED_OUTER_JOIN_TEMPLATE = _compact_sql("""
                 SELECT 1 as count 
                 FROM {table1} 
                 INNER JOIN {table2} ON {table1}.{pk1} = {table2}.{pk2}
                 RIGHT OUTER JOIN {table3} ON {table2}.{pk2} = {table3}.{pk3}
                 ORDER BY {table1}.{col1};
             """)
-            
-            # Another weird join pattern with multiple conditions
-            queries.append(f"""
+
+_MULTI_CONDITION_JOIN_TEMPLATE = _compact_sql("""
                 SELECT {table1}.{pk1}, {table2}.{pk2}, {table3}.{pk3}
                 FROM {table1}
                 LEFT JOIN {table2} ON {table1}.{pk1} = {table2}.{pk2}
                 INNER JOIN {table3} ON {table1}.{col1} = {table3}.{pk3}
                 WHERE {table2}.{pk2} IS NULL OR {table3}.{pk3} > 10;
             """)
-        
-        # Complex JOIN with a view if available
-        if self.view_names and len(self.table_names) >= 2:
-            view = self._get_random_view()
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            view_col = self._get_random_column(view)
-            
-            # Join with a view
-            queries.append(f"""
+
+_VIEW_JOIN_TEMPLATE = _compact_sql("""
                 SELECT {table1}.{pk1}, v.{view_col}, {table2}.{pk2}
                 FROM {table1}
                 INNER JOIN {view} v ON {table1}.{pk1} = v.{view_col}
                 LEFT OUTER JOIN {table2} ON v.{view_col} = {table2}.{pk2}
                 ORDER BY {table1}.{pk1};
             """)
-        
-        # NATURAL JOIN
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            queries.append(f"SELECT * FROM {table1} NATURAL JOIN {table2};")
-            queries.append(f"SELECT * FROM {table1} NATURAL LEFT JOIN {table2};")
-        
-        # JOIN with USING clause
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk = self._get_primary_key_column(table1)  # Assuming same PK name
-            queries.append(f"SELECT * FROM {table1} JOIN {table2} USING ({pk});")
-        
-        # Complex multi-level JOIN structure
-        if len(self.table_names) >= 4:
-            tables = self._get_random_tables(4)
-            pks = [self._get_primary_key_column(t) for t in tables]
-            
-            queries.append(f"""
+
+_NESTED_FOUR_TABLE_JOIN_TEMPLATE = _compact_sql("""
                 SELECT t1.{pks[0]}, t2.{pks[1]}, t3.{pks[2]}, t4.{pks[3]}
                 FROM {tables[0]} t1
                 LEFT JOIN (
@@ -361,13 +112,8 @@ class SchemaQueryGenerator:
                 ) ON t1.{pks[0]} = t2.{pks[1]}
                 RIGHT OUTER JOIN {tables[3]} t4 ON t3.{pks[2]} = t4.{pks[3]};
             """)
-        
-        # JOIN with a derived table/subquery
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        
-        queries.append(f"""
+
+_DERIVED_TABLE_JOIN_TEMPLATE = _compact_sql("""
             SELECT t.{pk}, d.avg_value
             FROM {table} t
             JOIN (
@@ -378,16 +124,8 @@ class SchemaQueryGenerator:
             ) d ON t.{col} = d.{col}
             WHERE t.{pk} > d.avg_value;
         """)
-        
-        # JOIN with CASE expression in the ON clause
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            
-            queries.append(f"""
+
+_CASE_ON_JOIN_TEMPLATE = _compact_sql("""
                 SELECT t1.{pk1}, t2.{pk2}
                 FROM {table1} t1
                 LEFT JOIN {table2} t2 ON 
@@ -397,20 +135,8 @@ class SchemaQueryGenerator:
                     END
                 WHERE t1.{pk1} < 100;
             """)
-        
-        # Multiple chained JOINs with mixed styles and complex conditions
-        if len(self.table_names) >= 3:
-            table1, table2, table3 = self._get_random_tables(3)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            pk3 = self._get_primary_key_column(table3)
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            col3 = self._get_random_column(table3)
-            view = self._get_random_view()
-            
-            # Extremely complex nested JOIN structure
-            queries.append(f"""
+
+_EXTREME_NESTED_JOIN_TEMPLATE = _compact_sql("""
                 SELECT 
                     t1.{pk1}, 
                     t2.{pk2}, 
@@ -433,9 +159,8 @@ class SchemaQueryGenerator:
                         ELSE t1.{pk1}
                     END;
             """)
-            
-            # JOIN chain with lateral join-like pattern
-            queries.append(f"""
+
+_LATERAL_LIKE_JOIN_TEMPLATE = _compact_sql("""
                 SELECT t1.{pk1}, t2.{pk2}, t3.{pk3}, grp.cnt
                 FROM {table1} t1
                 JOIN {table2} t2 
@@ -457,278 +182,22 @@ class SchemaQueryGenerator:
                 );
             """)
 
-            queries.append(f"""
+_VIEW_RIGHT_JOIN_TEMPLATE = _compact_sql("""
                 SELECT * FROM {table1} JOIN {view} ON {table1}.{col1} RIGHT JOIN {table2} ON {table1}.{col1};
             """)
-        
-        return queries
-    
-    def _generate_aggregate_queries(self) -> List[str]:
-        """Generate aggregate and GROUP BY queries."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            
-            # Find a numeric column for aggregations
-            numeric_columns = [col for col in self.schema_info[table]["column_names"] 
-                              if self._is_numeric_column(table, col)]
-            
-            if numeric_columns:
-                numeric_col = random.choice(numeric_columns)
-                
-                # Simple aggregation
-                queries.append(f"SELECT COUNT(*) FROM {table};")
-                queries.append(f"SELECT COUNT({numeric_col}) FROM {table};")
-                queries.append(f"SELECT SUM({numeric_col}) FROM {table};")
-                queries.append(f"SELECT AVG({numeric_col}) FROM {table};")
-                queries.append(f"SELECT MIN({numeric_col}), MAX({numeric_col}) FROM {table};")
-                
-                # GROUP BY
-                group_col = self._get_random_column(table)
-                if group_col != numeric_col:
-                    queries.append(f"SELECT {group_col}, COUNT(*) FROM {table} GROUP BY {group_col};")
-                    queries.append(f"SELECT {group_col}, SUM({numeric_col}) FROM {table} GROUP BY {group_col};")
-                    queries.append(f"SELECT {group_col}, AVG({numeric_col}) FROM {table} GROUP BY {group_col};")
-                    
-                    # With HAVING
-                    queries.append(f"SELECT {group_col}, COUNT(*) FROM {table} GROUP BY {group_col} HAVING COUNT(*) > 1;")
-                    queries.append(f"SELECT {group_col}, SUM({numeric_col}) FROM {table} GROUP BY {group_col} HAVING SUM({numeric_col}) > 10;")
-        
-        return queries
-    
-    def _generate_subquery_queries(self) -> List[str]:
-        """Generate queries with subqueries."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # Simple subquery in WHERE
-            queries.append(f"SELECT * FROM {table} WHERE {pk} IN (SELECT {pk} FROM {table} WHERE {col} IS NOT NULL);")
-            
-            # Subquery with comparison
-            if self._is_numeric_column(table, col):
-                queries.append(f"SELECT * FROM {table} WHERE {col} > (SELECT AVG({col}) FROM {table});")
-            
-            # Subquery in SELECT
-            queries.append(f"SELECT {pk}, (SELECT COUNT(*) FROM {table} t2 WHERE t2.{pk} <= {table}.{pk}) AS count_less_equal FROM {table};")
-            
-            # EXISTS subquery
-            queries.append(f"SELECT * FROM {table} t1 WHERE EXISTS (SELECT 1 FROM {table} t2 WHERE t2.{pk} = t1.{pk});")
-            
-            # NOT EXISTS subquery
-            queries.append(f"SELECT * FROM {table} t1 WHERE NOT EXISTS (SELECT 1 FROM {table} t2 WHERE t2.{pk} > t1.{pk});")
-            
-            # Subquery in FROM
-            queries.append(f"SELECT sub.{pk}, sub.{col} FROM (SELECT {pk}, {col} FROM {table} WHERE {col} IS NOT NULL) sub;")
-            
-            # Correlated subquery
-            if len(self.table_names) >= 2:
-                table2 = random.choice([t for t in self.table_names if t != table])
-                pk2 = self._get_primary_key_column(table2)
-                queries.append(f"SELECT t1.{pk}, (SELECT COUNT(*) FROM {table2} t2 WHERE t2.{pk2} = t1.{pk}) FROM {table} t1;")
-        
-        # ALL, ANY, SOME subqueries
-        table = self._get_random_table()
-        col = self._get_random_column(table)
-        if self._is_numeric_column(table, col):
-            queries.append(f"SELECT * FROM {table} WHERE {col} > ALL (SELECT {col} FROM {table} WHERE {pk} < 5);")
-            queries.append(f"SELECT * FROM {table} WHERE {col} > ANY (SELECT {col} FROM {table} WHERE {pk} < 5);")
-            queries.append(f"SELECT * FROM {table} WHERE {col} > SOME (SELECT {col} FROM {table} WHERE {pk} < 5);")
-        
-        return queries
-    
-    def _generate_insert_queries(self) -> List[str]:
-        """Generate INSERT queries."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            columns = self._get_random_columns(table, min_count=2, max_count=4)
-            columns_str = ", ".join(columns)
-            
-            # Generate appropriate values
-            values = []
-            for col in columns:
-                values.append(self._get_literal_for_column(table, col))
-            values_str = ", ".join(values)
-            
-            # Basic INSERT
-            queries.append(f"INSERT INTO {table} ({columns_str}) VALUES ({values_str});")
-            
-            # Multiple row INSERT
-            values2 = []
-            for col in columns:
-                values2.append(self._get_literal_for_column(table, col))
-            values2_str = ", ".join(values2)
-            
-            queries.append(f"INSERT INTO {table} ({columns_str}) VALUES ({values_str}), ({values2_str});")
-            
-            # INSERT OR REPLACE
-            queries.append(f"INSERT OR REPLACE INTO {table} ({columns_str}) VALUES ({values_str});")
-            
-            # INSERT OR IGNORE
-            queries.append(f"INSERT OR IGNORE INTO {table} ({columns_str}) VALUES ({values_str});")
-            
-            # INSERT with SELECT
-            queries.append(f"INSERT INTO {table} ({columns_str}) SELECT {columns_str} FROM {table} LIMIT 1;")
-        
-        # INSERT with RETURNING
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        queries.append(f"INSERT INTO {table} ({pk}, {col}) VALUES (999, {self._get_literal_for_column(table, col)}) RETURNING {pk}, {col};")
-        
-        # INSERT with ON CONFLICT
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        if self._is_numeric_column(table, col):
-            queries.append(f"INSERT INTO {table} ({pk}, {col}) VALUES (1, 100) ON CONFLICT({pk}) DO UPDATE SET {col} = {col} + 1;")
-            queries.append(f"INSERT INTO {table} ({pk}, {col}) VALUES (1, 100) ON CONFLICT({pk}) DO NOTHING;")
-        
-        return queries
-    
-    def _generate_update_queries(self) -> List[str]:
-        """Generate UPDATE queries."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # Basic UPDATE
-            queries.append(f"UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 1;")
-            
-            # Update with expressions
-            if self._is_numeric_column(table, col):
-                queries.append(f"UPDATE {table} SET {col} = {col} + 10 WHERE {pk} > 0;")
-                queries.append(f"UPDATE {table} SET {col} = {col} * 2 WHERE {pk} > 0;")
-            
-            # Update with NULL
-            queries.append(f"UPDATE {table} SET {col} = NULL WHERE {pk} = 2;")
-            
-            # Update with CASE
-            if self._is_numeric_column(table, col):
-                queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_update_queries
+# (also the CASE-in-UPDATE query of _generate_case_queries)
+_CASE_UPDATE_TEMPLATE = _compact_sql("""
                 UPDATE {table} SET {col} = CASE 
                     WHEN {pk} < 10 THEN {col} + 5 
                     WHEN {pk} < 20 THEN {col} + 10 
                     ELSE {col} 
                 END;
                 """)
-            
-            # Update with subquery
-            queries.append(f"UPDATE {table} SET {col} = (SELECT {col} FROM {table} WHERE {pk} = 1) WHERE {pk} = 2;")
-        
-        # UPDATE with RETURNING
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        queries.append(f"UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 1 RETURNING {pk}, {col};")
-        
-        # UPDATE multiple columns
-        table = self._get_random_table()
-        columns = self._get_random_columns(table, min_count=2, max_count=3)
-        set_clauses = []
-        for col in columns:
-            set_clauses.append(f"{col} = {self._get_literal_for_column(table, col)}")
-        set_str = ", ".join(set_clauses)
-        
-        queries.append(f"UPDATE {table} SET {set_str} WHERE {pk} = 1;")
-        
-        # UPDATE with OR
-        queries.append(f"UPDATE OR IGNORE {table} SET {col} = {self._get_literal_for_column(table, col)};")
-        
-        # UPDATE with ORDER BY and LIMIT
-        queries.append(f"UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} ORDER BY {pk} DESC LIMIT 5;")
-        
-        return queries
-    
-    def _generate_delete_queries(self) -> List[str]:
-        """Generate DELETE queries."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # Basic DELETE
-            queries.append(f"DELETE FROM {table} WHERE {pk} = 1;")
-            
-            # DELETE with complex condition
-            queries.append(f"DELETE FROM {table} WHERE {pk} > 10 AND {col} IS NOT NULL;")
-            
-            # DELETE all rows
-            queries.append(f"DELETE FROM {table};")
-            
-            # DELETE with subquery
-            queries.append(f"DELETE FROM {table} WHERE {pk} IN (SELECT {pk} FROM {table} WHERE {col} IS NULL);")
-        
-        # DELETE with ORDER BY and LIMIT
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        queries.append(f"DELETE FROM {table} ORDER BY {pk} DESC LIMIT 5;")
-        
-        return queries
-    
-    def _generate_order_limit_queries(self) -> List[str]:
-        """Generate queries with ORDER BY and LIMIT."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # ORDER BY ASC
-            queries.append(f"SELECT * FROM {table} ORDER BY {col} ASC;")
-            
-            # ORDER BY DESC
-            queries.append(f"SELECT * FROM {table} ORDER BY {col} DESC;")
-            
-            # ORDER BY multiple columns
-            col2 = self._get_random_column(table)
-            if col != col2:
-                queries.append(f"SELECT * FROM {table} ORDER BY {col} ASC, {col2} DESC;")
-            
-            # LIMIT
-            queries.append(f"SELECT * FROM {table} LIMIT 10;")
-            
-            # LIMIT with OFFSET
-            queries.append(f"SELECT * FROM {table} LIMIT 5 OFFSET 5;")
-            
-            # ORDER BY with LIMIT
-            queries.append(f"SELECT * FROM {table} ORDER BY {col} DESC LIMIT 10;")
-            
-            # ORDER BY with NULLS FIRST/LAST
-            queries.append(f"SELECT * FROM {table} ORDER BY {col} NULLS FIRST;")
-            queries.append(f"SELECT * FROM {table} ORDER BY {col} NULLS LAST;")
-            
-            # ORDER BY with COLLATE
-            if self._is_text_column(table, col):
-                queries.append(f"SELECT * FROM {table} ORDER BY {col} COLLATE NOCASE;")
-        
-        return queries
-    
-    def _generate_case_queries(self) -> List[str]:
-        """Generate queries with CASE expressions."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # Simple CASE
-            if self._is_numeric_column(table, col):
-                queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_case_queries
+_SIMPLE_CASE_TEMPLATE = _compact_sql("""
                 SELECT {pk}, CASE 
                     WHEN {col} < 10 THEN 'Low' 
                     WHEN {col} < 50 THEN 'Medium' 
@@ -736,243 +205,77 @@ class SchemaQueryGenerator:
                 END as category 
                 FROM {table};
                 """)
-            
-            # Searched CASE
-            queries.append(f"""
+
+_SEARCHED_CASE_TEMPLATE = _compact_sql("""
             SELECT {pk}, CASE {col}
                 WHEN NULL THEN 'Unknown'
                 ELSE 'Known'
             END as status
             FROM {table};
             """)
-            
-            # CASE in ORDER BY
-            queries.append(f"""
+
+_CASE_ORDER_BY_TEMPLATE = _compact_sql("""
             SELECT * FROM {table}
             ORDER BY CASE
                 WHEN {col} IS NULL THEN 1
                 ELSE 0
             END, {pk};
             """)
-        
-        # CASE in UPDATE
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        if self._is_numeric_column(table, col):
-            queries.append(f"""
-            UPDATE {table} SET {col} = CASE
-                WHEN {pk} < 10 THEN {col} + 5
-                WHEN {pk} < 20 THEN {col} + 10
-                ELSE {col}
-            END;
-            """)
-        
-        return queries
-    
-    def _generate_union_queries(self) -> List[str]:
-        """Generate UNION, EXCEPT, INTERSECT queries."""
-        queries = []
-        
-        # Make sure we have at least 2 tables
-        if len(self.table_names) < 2:
-            return queries
-        
-        for _ in range(2):
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            
-            # UNION
-            queries.append(f"SELECT {pk1} FROM {table1} UNION SELECT {pk2} FROM {table2};")
-            
-            # UNION ALL
-            queries.append(f"SELECT {pk1} FROM {table1} UNION ALL SELECT {pk2} FROM {table2};")
-            
-            # EXCEPT
-            queries.append(f"SELECT {pk1} FROM {table1} EXCEPT SELECT {pk2} FROM {table2};")
-            
-            # INTERSECT
-            queries.append(f"SELECT {pk1} FROM {table1} INTERSECT SELECT {pk2} FROM {table2};")
-        
-        # Complex UNION with subqueries
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            
-            queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_union_queries
+_UNION_SUBQUERY_TEMPLATE = _compact_sql("""
             SELECT {pk1}, 'Table1' as source FROM {table1} WHERE {pk1} < 10
             UNION
             SELECT {pk2}, 'Table2' as source FROM {table2} WHERE {pk2} < 10
             ORDER BY 1;
             """)
-        
-        return queries
-    
-    def _generate_view_queries(self) -> List[str]:
-        """Generate queries for views."""
-        queries = []
-        
-        for _ in range(2):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            columns = self._get_random_columns(table, min_count=2, max_count=3)
-            columns_str = ", ".join(columns)
-            
-            # CREATE VIEW
-            view_name = f"v_{table}_{random.randint(1, 1000)}"
-            queries.append(f"CREATE VIEW {view_name} AS SELECT {columns_str} FROM {table};")
-            
-            # CREATE TEMPORARY VIEW
-            temp_view_name = f"temp_v_{table}_{random.randint(1, 1000)}"
-            queries.append(f"CREATE TEMPORARY VIEW {temp_view_name} AS SELECT {columns_str} FROM {table};")
-            
-            # DROP VIEW
-            queries.append(f"DROP VIEW IF EXISTS {view_name};")
-            
-            # Create view with complex query
-            complex_view_name = f"complex_v_{table}_{random.randint(1, 1000)}"
-            queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_view_queries
+_COMPLEX_VIEW_TEMPLATE = _compact_sql("""
             CREATE VIEW {complex_view_name} AS
-            SELECT {pk}, COUNT(*) as count, SUM({columns[0]}) as total
+            SELECT {pk}, COUNT(*) as count, SUM({col}) as total
             FROM {table}
             GROUP BY {pk};
             """)
-        
-        # Use existing views in queries
-        for view_name in self.view_names:
-            col = self._get_random_column(view_name)
-            queries.append(f"SELECT * FROM {view_name};")
-            queries.append(f"SELECT {col} FROM {view_name} WHERE {col} IS NOT NULL;")
-            
-            # Join view with table
-            if self.table_names:
-                table = self._get_random_table()
-                pk = self._get_primary_key_column(table)
-                queries.append(f"SELECT v.{col}, t.{pk} FROM {view_name} v JOIN {table} t ON v.{col} = t.{pk};")
-        
-        return queries
-    
-    def _generate_index_queries(self) -> List[str]:
-        """Generate queries for indexes."""
-        queries = []
-        
-        for _ in range(2):
-            table = self._get_random_table()
-            column = self._get_random_column(table)
-            
-            # CREATE INDEX
-            index_name = f"idx_{table}_{column}_{random.randint(1, 1000)}"
-            queries.append(f"CREATE INDEX {index_name} ON {table}({column});")
-            
-            # CREATE UNIQUE INDEX
-            unique_index_name = f"uix_{table}_{column}_{random.randint(1, 1000)}"
-            queries.append(f"CREATE UNIQUE INDEX {unique_index_name} ON {table}({column});")
-            
-            # CREATE INDEX IF NOT EXISTS
-            queries.append(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column});")
-            
-            # DROP INDEX
-            queries.append(f"DROP INDEX IF EXISTS {index_name};")
-            
-            # CREATE INDEX with multiple columns
-            col2 = self._get_random_column(table)
-            if column != col2:
-                multi_index_name = f"idx_{table}_{column}_{col2}_{random.randint(1, 1000)}"
-                queries.append(f"CREATE INDEX {multi_index_name} ON {table}({column}, {col2});")
-            
-            # CREATE INDEX with WHERE clause
-            where_index_name = f"idx_{table}_{column}_where_{random.randint(1, 1000)}"
-            queries.append(f"CREATE INDEX {where_index_name} ON {table}({column}) WHERE {column} IS NOT NULL;")
-            
-            # CREATE INDEX with COLLATE
-            if self._is_text_column(table, column):
-                collate_index_name = f"idx_{table}_{column}_collate_{random.randint(1, 1000)}"
-                queries.append(f"CREATE INDEX {collate_index_name} ON {table}({column} COLLATE NOCASE);")
-        
-        # REINDEX
-        table = self._get_random_table()
-        queries.append(f"REINDEX {table};")
-        
-        # REINDEX a specific index
-        index = self._get_random_index(table)
-        if index:
-            queries.append(f"REINDEX {index};")
-        
-        return queries
-    
-    def _generate_transaction_queries(self) -> List[str]:
-        """Generate transaction queries."""
-        queries = []
-        
-        # Basic transaction
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_transaction_queries
+_BASIC_TRANSACTION_TEMPLATE = _compact_sql("""
         BEGIN TRANSACTION;
-        UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 1;
+        UPDATE {table} SET {col} = {literal} WHERE {pk} = 1;
         COMMIT;
         """)
-        
-        # Transaction with ROLLBACK
-        queries.append(f"""
+
+_ROLLBACK_TRANSACTION_TEMPLATE = _compact_sql("""
         BEGIN;
-        UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 2;
+        UPDATE {table} SET {col} = {literal} WHERE {pk} = 2;
         ROLLBACK;
         """)
-        
-        # Transaction with SAVEPOINT
-        queries.append(f"""
+
+_SAVEPOINT_TRANSACTION_TEMPLATE = _compact_sql("""
         BEGIN;
-        UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 3;
+        UPDATE {table} SET {col} = {literal} WHERE {pk} = 3;
         SAVEPOINT sp1;
-        UPDATE {table} SET {col} = {self._get_literal_for_column(table, col)} WHERE {pk} = 4;
+        UPDATE {table} SET {col} = {literal} WHERE {pk} = 4;
         ROLLBACK TO SAVEPOINT sp1;
         COMMIT;
         """)
-        
-        # Various transaction types
-        queries.append("BEGIN IMMEDIATE TRANSACTION; COMMIT;")
-        queries.append("BEGIN EXCLUSIVE TRANSACTION; COMMIT;")
-        queries.append("BEGIN DEFERRED TRANSACTION; COMMIT;")
-        
-        # Transaction with multiple operations
-        queries.append(f"""
+
+_DELETE_INSERT_TRANSACTION_TEMPLATE = _compact_sql("""
         BEGIN TRANSACTION;
         DELETE FROM {table} WHERE {pk} = 5;
-        INSERT INTO {table} ({pk}, {col}) VALUES (5, {self._get_literal_for_column(table, col)});
+        INSERT INTO {table} ({pk}, {col}) VALUES (5, {insert_literal});
         COMMIT;
         """)
-        
-        # SAVEPOINT operations
-        queries.append("SAVEPOINT sp_name; RELEASE SAVEPOINT sp_name;")
-        queries.append("SAVEPOINT sp_name; ROLLBACK TO SAVEPOINT sp_name;")
-        
-        return queries
-    
-    def _generate_cte_queries(self) -> List[str]:
-        """Generate queries with Common Table Expressions (WITH clause)."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            # Simple WITH clause
-            queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_cte_queries
+_SIMPLE_CTE_TEMPLATE = _compact_sql("""
             WITH temp_data AS (
                 SELECT {pk}, {col} FROM {table} WHERE {col} IS NOT NULL
             )
             SELECT * FROM temp_data;
             """)
-            
-            # Multiple CTEs
-            col2 = self._get_random_column(table)
-            if col != col2:
-                queries.append(f"""
+
+_MULTIPLE_CTE_TEMPLATE = _compact_sql("""
                 WITH 
                 data1 AS (
                     SELECT {pk}, {col} FROM {table} WHERE {col} IS NOT NULL
@@ -984,10 +287,8 @@ class SchemaQueryGenerator:
                 FROM data1 d1
                 JOIN data2 d2 ON d1.{pk} = d2.{pk};
                 """)
-            
-            # WITH clause with aggregation
-            if self._is_numeric_column(table, col):
-                queries.append(f"""
+
+_AGGREGATE_CTE_TEMPLATE = _compact_sql("""
                 WITH agg_data AS (
                     SELECT {col}, COUNT(*) as count, AVG({col}) as avg_val
                     FROM {table}
@@ -995,11 +296,8 @@ class SchemaQueryGenerator:
                 )
                 SELECT * FROM agg_data WHERE count > 1;
                 """)
-        
-        # WITH RECURSIVE
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        queries.append(f"""
+
+_RECURSIVE_CTE_QUERY = _compact_sql("""
         WITH RECURSIVE numbers(n) AS (
             SELECT 1
             UNION ALL
@@ -1007,12 +305,8 @@ class SchemaQueryGenerator:
         )
         SELECT n FROM numbers;
         """)
-        
-        # Complex WITH clause
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        col = self._get_random_column(table)
-        queries.append(f"""
+
+_RANKED_CTE_TEMPLATE = _compact_sql("""
         WITH ranked_data AS (
             SELECT {pk}, {col},
                    ROW_NUMBER() OVER (ORDER BY {col}) as row_num
@@ -1021,181 +315,32 @@ class SchemaQueryGenerator:
         )
         SELECT * FROM ranked_data WHERE row_num <= 5;
         """)
-        
-        return queries
-    
-    def _generate_function_queries(self) -> List[str]:
-        """Generate queries with SQL functions."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            
-            # String functions
-            text_columns = [col for col in self.schema_info[table]["column_names"] 
-                           if self._is_text_column(table, col)]
-            
-            if text_columns:
-                col = random.choice(text_columns)
-                queries.append(f"SELECT UPPER({col}) FROM {table};")
-                queries.append(f"SELECT LOWER({col}) FROM {table};")
-                queries.append(f"SELECT LENGTH({col}) FROM {table};")
-                queries.append(f"SELECT SUBSTR({col}, 1, 3) FROM {table};")
-                queries.append(f"SELECT INSTR({col}, 'a') FROM {table};")
-                queries.append(f"SELECT REPLACE({col}, 'a', 'A') FROM {table};")
-                queries.append(f"SELECT TRIM({col}) FROM {table};")
-                queries.append(f"SELECT LTRIM(RTRIM({col})) FROM {table};")
-                queries.append(f"SELECT {col} || ' suffix' FROM {table};")
-            
-            # Numeric functions
-            num_columns = [col for col in self.schema_info[table]["column_names"] 
-                          if self._is_numeric_column(table, col)]
-            
-            if num_columns:
-                col = random.choice(num_columns)
-                queries.append(f"SELECT ABS({col}) FROM {table};")
-                queries.append(f"SELECT ROUND({col}, 2) FROM {table};")
-                queries.append(f"SELECT CEIL({col}) FROM {table};")
-                queries.append(f"SELECT FLOOR({col}) FROM {table};")
-                
-                # Math expressions
-                queries.append(f"SELECT {col} + 10 FROM {table};")
-                queries.append(f"SELECT {col} * 2 FROM {table};")
-                queries.append(f"SELECT {col} / NULLIF(2, 0) FROM {table};")  # Prevent division by zero
-            
-            # Date functions
-            date_columns = [col for col in self.schema_info[table]["column_names"] 
-                           if self._is_date_column(table, col)]
-            
-            if date_columns:
-                col = random.choice(date_columns)
-                queries.append(f"SELECT date({col}, '+1 day') FROM {table};")
-                queries.append(f"SELECT strftime('%Y-%m-%d', {col}) FROM {table};")
-                queries.append(f"SELECT datetime({col}, 'start of month') FROM {table};")
-            
-            # NULL handling
-            col = self._get_random_column(table)
-            queries.append(f"SELECT COALESCE({col}, 'N/A') FROM {table};")
-            queries.append(f"SELECT NULLIF({col}, 'unknown') FROM {table};")
-            queries.append(f"SELECT IFNULL({col}, 0) FROM {table};")
-        
-        # SQLite-specific functions
-        # queries.append("SELECT random();")
-        queries.append("SELECT quote('string''with quotes');")
-        queries.append("SELECT typeof(42), typeof('text'), typeof(3.14), typeof(NULL);")
-        
-        # Type casting
-        table = self._get_random_table()
-        col = self._get_random_column(table)
-        queries.append(f"SELECT CAST({col} AS TEXT) FROM {table};")
-        queries.append(f"SELECT CAST({col} AS INTEGER) FROM {table};")
-        queries.append(f"SELECT CAST({col} AS REAL) FROM {table};")
-        
-        queries.append(f"SELECT CAST(1 AS TEXT) FROM {table};")
-        queries.append(f"SELECT CAST(5.0 AS INTEGER) FROM {table};")
-        queries.append(f"SELECT CAST(20 AS REAL) FROM {table};")
 
-        return queries
-    
-    def _generate_window_function_queries(self) -> List[str]:
-        """Generate queries with window functions."""
-        queries = []
-        
-        for _ in range(3):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            
-            # Find a numeric column for window functions
-            numeric_columns = [col for col in self.schema_info[table]["column_names"] 
-                              if self._is_numeric_column(table, col)]
-            
-            if numeric_columns:
-                col = random.choice(numeric_columns)
-                
-                # Basic window function
-                queries.append(f"SELECT {pk}, {col}, AVG({col}) OVER () as avg_total FROM {table};")
-                
-                # Window function with PARTITION BY
-                partition_col = self._get_random_column(table)
-                if partition_col != col:
-                    queries.append(f"SELECT {pk}, {partition_col}, {col}, AVG({col}) OVER (PARTITION BY {partition_col}) as avg_by_group FROM {table};")
-                
-                # Window function with ORDER BY
-                queries.append(f"SELECT {pk}, {col}, SUM({col}) OVER (ORDER BY {pk}) as running_sum FROM {table};")
-                
-                # Window function with both PARTITION BY and ORDER BY
-                if partition_col != col:
-                    queries.append(f"SELECT {pk}, {partition_col}, {col}, SUM({col}) OVER (PARTITION BY {partition_col} ORDER BY {pk}) as running_sum_by_group FROM {table};")
-                
-                # Row numbering functions
-                queries.append(f"SELECT {pk}, {col}, ROW_NUMBER() OVER (ORDER BY {col}) as row_num FROM {table};")
-                queries.append(f"SELECT {pk}, {col}, RANK() OVER (ORDER BY {col}) as rank_val FROM {table};")
-                queries.append(f"SELECT {pk}, {col}, DENSE_RANK() OVER (ORDER BY {col}) as dense_rank_val FROM {table};")
-                
-                # NTILE
-                queries.append(f"SELECT {pk}, {col}, NTILE(4) OVER (ORDER BY {col}) as quartile FROM {table};")
-                
-                # Lead and lag
-                queries.append(f"SELECT {pk}, {col}, LAG({col}, 1) OVER (ORDER BY {pk}) as prev_val FROM {table};")
-                queries.append(f"SELECT {pk}, {col}, LEAD({col}, 1) OVER (ORDER BY {pk}) as next_val FROM {table};")
-                
-                # First_value and last_value
-                queries.append(f"SELECT {pk}, {col}, FIRST_VALUE({col}) OVER (ORDER BY {pk}) as first_val FROM {table};")
-                queries.append(f"SELECT {pk}, {col}, LAST_VALUE({col}) OVER (ORDER BY {pk} RANGE BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING) as last_val FROM {table};")
-        
-        return queries
-    
-    def _generate_schema_queries(self) -> List[str]:
-        """Generate schema alteration queries."""
-        queries = []
-        
-        # CREATE TABLE
-        new_table_name = f"new_table_{random.randint(1, 1000)}"
-        queries.append(f"""
+# Query templates for the multi-line queries in _generate_schema_queries
+_CREATE_TABLE_TEMPLATE = _compact_sql("""
         CREATE TABLE {new_table_name} (
             id INTEGER PRIMARY KEY,
             name TEXT,
             value REAL
         );
         """)
-        
-        # CREATE TABLE IF NOT EXISTS
-        queries.append(f"""
+
+_CREATE_TABLE_IF_NOT_EXISTS_TEMPLATE = _compact_sql("""
         CREATE TABLE IF NOT EXISTS {new_table_name} (
             id INTEGER PRIMARY KEY,
             name TEXT,
             value REAL
         );
         """)
-        
-        # CREATE TEMPORARY TABLE
-        temp_table_name = f"temp_table_{random.randint(1, 1000)}"
-        queries.append(f"""
+
+_CREATE_TEMP_TABLE_TEMPLATE = _compact_sql("""
         CREATE TEMPORARY TABLE {temp_table_name} (
             id INTEGER PRIMARY KEY,
             data TEXT
         );
         """)
-        
-        # DROP TABLE
-        queries.append(f"DROP TABLE IF EXISTS {new_table_name};")
-        
-        # ALTER TABLE statements
-        table = self._get_random_table()
-        
-        # ALTER TABLE ADD COLUMN
-        queries.append(f"ALTER TABLE {table} ADD COLUMN new_col TEXT;")
-        
-        # ALTER TABLE RENAME TO
-        queries.append(f"ALTER TABLE {table} RENAME TO {table}_renamed;")
-        
-        # ALTER TABLE RENAME COLUMN
-        col = self._get_random_column(table)
-        queries.append(f"ALTER TABLE {table} RENAME COLUMN {col} TO {col}_renamed;")
-        
-        # CREATE TABLE with constraints
-        constraints_table = f"constraints_table_{random.randint(1, 1000)}"
-        queries.append(f"""
+
+_CONSTRAINTS_TABLE_TEMPLATE = _compact_sql("""
         CREATE TABLE {constraints_table} (
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
@@ -1204,13 +349,8 @@ class SchemaQueryGenerator:
             category TEXT DEFAULT 'General'
         );
         """)
-        
-        # CREATE TABLE with foreign key
-        if self.table_names:
-            fk_table = self._get_random_table()
-            fk_col = self._get_primary_key_column(fk_table)
-            fk_ref_table = f"fk_table_{random.randint(1, 1000)}"
-            queries.append(f"""
+
+_FOREIGN_KEY_TABLE_TEMPLATE = _compact_sql("""
             CREATE TABLE {fk_ref_table} (
                 id INTEGER PRIMARY KEY,
                 {fk_table}_id INTEGER,
@@ -1218,89 +358,35 @@ class SchemaQueryGenerator:
                 FOREIGN KEY ({fk_table}_id) REFERENCES {fk_table}({fk_col})
             );
             """)
-        
-        # PRAGMA statements
-        if self.table_names:
-            table = self._get_random_table()
-            queries.append(f"PRAGMA table_info({table});")
-            queries.append(f"PRAGMA index_list({table});")
-            queries.append(f"PRAGMA foreign_key_list({table});")
-        
-        # Additional PRAGMA statements
-        queries.append("PRAGMA journal_mode = WAL;")
-        queries.append("PRAGMA synchronous = NORMAL;")
-        queries.append("PRAGMA cache_size = 10000;")
-        
-        # CREATE TABLE without ROWID
-        queries.append(f"""
-        CREATE TABLE no_rowid_table_{random.randint(1, 1000)} (
+
+_WITHOUT_ROWID_TABLE_TEMPLATE = _compact_sql("""
+        CREATE TABLE {no_rowid_table} (
             id INTEGER PRIMARY KEY,
             name TEXT
         ) WITHOUT ROWID;
         """)
-        
-        # CREATE trigger
-        trigger_table = self._get_random_table()
-        trigger_name = f"trg_{trigger_table}_{random.randint(1, 1000)}"
-        queries.append(f"""
+
+_TRIGGER_TEMPLATE = _compact_sql("""
         CREATE TRIGGER {trigger_name}
         AFTER INSERT ON {trigger_table}
         BEGIN
             UPDATE {trigger_table} SET c1 = NEW.c0 WHERE c0 = NEW.c0;
         END;
         """)
-        
-        # DROP trigger
-        queries.append(f"DROP TRIGGER IF EXISTS {trigger_name};")
-        
-        return queries
-    
-    def _generate_materialized_queries(self) -> List[str]:
-        """
-        Generate queries with explicit MATERIALIZED and NOT MATERIALIZED hints,
-        along with other advanced SQL features.
-        """
-        queries = []
-        
-        # Example with explicit MATERIALIZED
-        queries.append("""
-            WITH t(a) AS MATERIALIZED (SELECT json('{"x": 10}'))
-            SELECT json_extract(a, '$.x') FROM t;
-        """)
-        
-        # Multiple CTEs with different materialization strategies
-        queries.append("""
-            WITH 
-            t1(a) AS MATERIALIZED (SELECT 1),
-            t2(b) AS NOT MATERIALIZED (SELECT 2),
-            t3(c) AS (SELECT 3)
-            SELECT t1.a, t2.b, t3.c FROM t1, t2, t3;
-        """)
-        
-        # --- Materialization with dynamic data ---
-        
-        # Get some tables and columns for building dynamic queries
-        if self.table_names:
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            cols = self._get_random_columns(table, min_count=2, max_count=3)
-            
-            # CTE with materialization and table data
-            queries.append(f"""
+
+# Query templates for the multi-line queries in _generate_materialized_queries,
+# with hints chosen by _annotate_cte_materialization for CTEs written without one
+_MATERIALIZED_TABLE_CTE_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
                 WITH data AS MATERIALIZED (
-                    SELECT {pk}, {', '.join(cols)}
+                    SELECT {pk}, {columns_str}
                     FROM {table}
                     WHERE {pk} < 100
                 )
                 SELECT * FROM data
-                WHERE {cols[0]} IS NOT NULL;
-            """)
-            
-            # Multiple CTEs with mixed materialization
-            col1 = cols[0]
-            col2 = cols[1] if len(cols) > 1 else cols[0]
-            
-            queries.append(f"""
+                WHERE {col1} IS NOT NULL;
+            """))
+
+_MIXED_MATERIALIZATION_CTE_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
                 WITH 
                 raw_data AS MATERIALIZED (
                     SELECT {pk}, {col1}, {col2}
@@ -1324,106 +410,27 @@ class SchemaQueryGenerator:
                 FROM raw_data r
                 LEFT JOIN aggregated a ON r.{col1} = a.{col1}
                 LEFT JOIN filtered f ON a.{col1} = f.{col1};
-            """)
-        
-        # --- Complex materialized queries with functions and expressions ---
-        
-        # JSON functions with NOT MATERIALIZED
-        queries.append("""
-            WITH 
-            json_data(doc) AS NOT MATERIALIZED (
-                SELECT json('{"id": 123, "values": [1, 2, 3], "nested": {"key": "value"}}')
-            ),
-            extracted(id, first_val, key_val) AS MATERIALIZED (
-                SELECT 
-                    json_extract(doc, '$.id'),
-                    json_extract(doc, '$.values[0]'),
-                    json_extract(doc, '$.nested.key')
-                FROM json_data
-            )
-            SELECT * FROM extracted;
-        """)
-        
-        # Math functions with materialization
-        queries.append("""
-            WITH 
-            numbers(n) AS MATERIALIZED (
-                SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5
-            ),
-            calculations AS NOT MATERIALIZED (
-                SELECT 
-                    n,
-                    n*n as squared,
-                    pow(n, 3) as cubed,
-                    sqrt(n) as square_root
-                FROM numbers
-            )
-            SELECT * FROM calculations
-            ORDER BY n;
-        """)
-        
-        # Date functions
-        queries.append("""
-            WITH 
-            dates(d) AS MATERIALIZED (
-                SELECT date('now') UNION ALL
-                SELECT date('now', '+1 day') UNION ALL
-                SELECT date('now', '+2 days') UNION ALL
-                SELECT date('now', '+1 month') UNION ALL
-                SELECT date('now', '+1 year')
-            ),
-            formatted AS NOT MATERIALIZED (
-                SELECT 
-                    d,
-                    strftime('%Y', d) as year,
-                    strftime('%m', d) as month,
-                    strftime('%d', d) as day
-                FROM dates
-            )
-            SELECT * FROM formatted;
-        """)
-        
-        # Recursive CTE with materialization
-        queries.append("""
-            WITH RECURSIVE 
-            fibonacci(a, b) AS NOT MATERIALIZED (
-                SELECT 0, 1
-                UNION ALL
-                SELECT b, a+b FROM fibonacci
-                WHERE b < 100
-            )
-            SELECT a as fibonacci_number FROM fibonacci;
-        """)
-        
-        # --- Combination of materialization with other advanced features ---
-        
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            
-            # Materialization + Window functions + Join
-            queries.append(f"""
-                WITH 
-                t1_data AS MATERIALIZED (
-                    SELECT 
-                        {pk1}, 
-                        {col1},
-                        ROW_NUMBER() OVER(ORDER BY {pk1}) as row_num,
-                        RANK() OVER(ORDER BY {col1}) as rank_val
-                    FROM {table1}
-                    WHERE {col1} IS NOT NULL
-                ),
-                t2_data AS NOT MATERIALIZED (
-                    SELECT 
-                        {pk2}, 
-                        {col2},
-                        COUNT(*) OVER(PARTITION BY {col2}) as count_in_group
-                    FROM {table2}
-                    WHERE {col2} IS NOT NULL
-                )
+            """))
+
+_MATERIALIZED_WINDOW_JOIN_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
+                WITH 
+                t1_data AS MATERIALIZED (
+                    SELECT 
+                        {pk1}, 
+                        {col1},
+                        ROW_NUMBER() OVER(ORDER BY {pk1}) as row_num,
+                        RANK() OVER(ORDER BY {col1}) as rank_val
+                    FROM {table1}
+                    WHERE {col1} IS NOT NULL
+                ),
+                t2_data AS NOT MATERIALIZED (
+                    SELECT 
+                        {pk2}, 
+                        {col2},
+                        COUNT(*) OVER(PARTITION BY {col2}) as count_in_group
+                    FROM {table2}
+                    WHERE {col2} IS NOT NULL
+                )
                 SELECT 
                     t1.{pk1},
                     t1.{col1},
@@ -1434,10 +441,9 @@ class SchemaQueryGenerator:
                 LEFT JOIN t2_data t2 ON t1.{pk1} = t2.{pk2}
                 WHERE t1.rank_val <= 10
                 ORDER BY t1.row_num;
-            """)
-            
-            # Materialization + Subqueries + CASE
-            queries.append(f"""
+            """))
+
+_MATERIALIZED_SUBQUERY_CASE_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
                 WITH 
                 base_data AS MATERIALIZED (
                     SELECT * FROM {table1}
@@ -1465,15 +471,9 @@ class SchemaQueryGenerator:
                 FROM categories
                 GROUP BY category
                 ORDER BY count DESC;
-            """)
-        
-        # Advanced nested materialization pattern
-        if self.table_names:
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            col = self._get_random_column(table)
-            
-            queries.append(f"""
+            """))
+
+_MATERIALIZED_RECURSIVE_GROUP_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
                 WITH RECURSIVE
                 counter(n) AS NOT MATERIALIZED (
                     SELECT 1
@@ -1504,20 +504,9 @@ class SchemaQueryGenerator:
                     values_json
                 FROM grouped_data
                 WHERE json_array_length(values_json) > 0;
-            """)
-        
-        # --- Super complex materialized query ---
-        
-        if len(self.table_names) >= 3:
-            table1, table2, table3 = self._get_random_tables(3)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            pk3 = self._get_primary_key_column(table3)
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            col3 = self._get_random_column(table3)
-            
-            queries.append(f"""
+            """))
+
+_MATERIALIZED_MULTI_TABLE_TEMPLATE = _annotate_cte_materialization(_compact_sql("""
                 WITH 
                 t1_base AS MATERIALIZED (
                     SELECT 
@@ -1587,30 +576,10 @@ class SchemaQueryGenerator:
                 GROUP BY quartile, category
                 HAVING count > 1
                 ORDER BY quartile, category;
-            """)
-        
-        return queries
-    
-    def _generate_nested_queries(self) -> List[str]:
-        """
-        Generate complex nested queries with multiple levels (depth) of nesting.
-        Incorporates various SQL features like subqueries, CTEs, joins, aggregates
-        and window functions at different nesting depths.
-        """
-        queries = []
-        
-        # --- Simple Nested Subqueries (Level 2) ---
-        for _ in range(2):
-            table = self._get_random_table()
-            pk = self._get_primary_key_column(table)
-            
-            # Get two distinct columns
-            columns = self._get_random_columns(table, min_count=2, max_count=2)
-            col1 = columns[0]
-            col2 = columns[1]
-            
-            # Nested WHERE subquery
-            queries.append(f"""
+            """))
+
+# Query templates for the multi-line queries in _generate_nested_queries
+_NESTED_WHERE_SUBQUERY_TEMPLATE = _compact_sql("""
             SELECT {pk}, {col1} 
             FROM {table}
             WHERE {col2} IN (
@@ -1619,9 +588,8 @@ class SchemaQueryGenerator:
                 WHERE {col1} IS NOT NULL AND {pk} < 100
             );
             """)
-            
-            # FROM clause subquery with filtering
-            queries.append(f"""
+
+_FILTERED_FROM_SUBQUERY_TEMPLATE = _compact_sql("""
             SELECT outer_query.{pk}, outer_query.row_num
             FROM (
                 SELECT {pk}, {col1}, 
@@ -1631,18 +599,8 @@ class SchemaQueryGenerator:
             ) outer_query
             WHERE outer_query.row_num < 10;
             """)
-        
-        # --- Double Nested Subqueries (Level 3) ---
-        for _ in range(2):
-            if len(self.table_names) >= 2:
-                table1, table2 = self._get_random_tables(2)
-                pk1 = self._get_primary_key_column(table1)
-                pk2 = self._get_primary_key_column(table2)
-                col1 = self._get_random_column(table1)
-                col2 = self._get_random_column(table2)
-                
-                # Level 3 nesting with multiple features
-                queries.append(f"""
+
+_CORRELATED_COUNT_SUBQUERY_TEMPLATE = _compact_sql("""
                 SELECT t1.{pk1}, t1.{col1},
                     (SELECT COUNT(*) 
                     FROM {table2} t2 
@@ -1655,9 +613,28 @@ class SchemaQueryGenerator:
                 FROM {table1} t1
                 WHERE t1.{col1} IS NOT NULL;
                 """)
-                
-                # Level 3 nesting with different features
-                queries.append(f"""
+
+# The same query with the correlated subquery evaluated once per distinct t1.{col1}
+_MEMOIZED_CORRELATED_COUNT_TEMPLATE = _compact_sql("""
+                WITH related_counts(k, v) AS MATERIALIZED (
+                    SELECT k1.{col1},
+                        (SELECT COUNT(*) 
+                        FROM {table2} t2 
+                        WHERE t2.{pk2} IN (
+                            SELECT t3.{pk2} 
+                            FROM {table2} t3 
+                            WHERE t3.{col2} > k1.{col1} AND t3.{pk2} < 50
+                        )
+                        )
+                    FROM (SELECT DISTINCT {col1} FROM {table1} WHERE {col1} IS NOT NULL) k1
+                )
+                SELECT t1.{pk1}, t1.{col1},
+                    (SELECT v FROM related_counts WHERE k = t1.{col1}) as related_count
+                FROM {table1} t1
+                WHERE t1.{col1} IS NOT NULL;
+                """)
+
+_NESTED_DERIVED_JOIN_TEMPLATE = _compact_sql("""
                 SELECT * FROM (
                     SELECT t1.{pk1}, t1.{col1}, 
                         (SELECT AVG(t3.{col2}) 
@@ -1671,21 +648,8 @@ class SchemaQueryGenerator:
                 ) complex_data
                 WHERE avg_value IS NOT NULL;
                 """)
-        
-        # --- Complex WITH Clause and Nested Subqueries (Level 3+) ---
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            col1 = self._get_random_column(table1)
-            numeric_cols = [col for col in self.schema_info[table1]["column_names"] 
-                            if self._is_numeric_column(table1, col)]
-            
-            if numeric_cols:
-                num_col = random.choice(numeric_cols)
-                
-                # WITH clauses + nesting
-                queries.append(f"""
+
+_NESTED_AGGREGATE_CTE_TEMPLATE = _compact_sql("""
                 WITH 
                 base_data AS (
                     SELECT {pk1}, {col1}, {num_col}
@@ -1715,21 +679,8 @@ class SchemaQueryGenerator:
                 )
                 ORDER BY a.avg_val DESC;
                 """)
-        
-        # --- Super Complex Nested Queries (Level 4+) ---
-        if len(self.table_names) >= 3:
-            table1, table2, table3 = self._get_random_tables(3)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            pk3 = self._get_primary_key_column(table3)
-            
-            # Get columns for each table
-            col1 = self._get_random_column(table1)
-            col2 = self._get_random_column(table2)
-            col3 = self._get_random_column(table3)
-            
-            # Deeply nested with multiple features
-            queries.append(f"""
+
+_RECURSIVE_NESTED_COUNT_TEMPLATE = _compact_sql("""
             WITH RECURSIVE 
             counter(n) AS (
                 SELECT 1
@@ -1763,9 +714,8 @@ class SchemaQueryGenerator:
             WHERE f.rank_val <= 3
             ORDER BY c.n, f.rank_val;
             """)
-            
-            # Complex nested window functions and aggregates
-            queries.append(f"""
+
+_NESTED_WINDOW_AGGREGATE_TEMPLATE = _compact_sql("""
             WITH 
             t1_stats AS (
                 SELECT {col1}, 
@@ -1814,22 +764,8 @@ class SchemaQueryGenerator:
             WHERE main.rank_in_category <= 2
             ORDER BY main.category, main.rank_in_category;
             """)
-        
-        # --- CTE with Deep Nesting and Multiple Features ---
-        if len(self.table_names) >= 2:
-            table1, table2 = self._get_random_tables(2)
-            pk1 = self._get_primary_key_column(table1)
-            pk2 = self._get_primary_key_column(table2)
-            
-            # Get distinct columns for table1
-            t1_columns = self._get_random_columns(table1, min_count=2, max_count=2)
-            col1a = t1_columns[0]
-            col1b = t1_columns[1]
-            
-            col2 = self._get_random_column(table2)
-            
-            # CTE with subquery and window function combinations
-            queries.append(f"""
+
+_QUARTILE_CTE_TEMPLATE = _compact_sql("""
             WITH 
             base_data AS (
                 SELECT {pk1}, {col1a}, {col1b},
@@ -1874,18 +810,8 @@ class SchemaQueryGenerator:
             )
             ORDER BY bd.quartile, bd.row_num;
             """)
-        
-        # --- Combine Multiple Techniques in One Query ---
-        table = self._get_random_table()
-        pk = self._get_primary_key_column(table)
-        
-        # Get two distinct columns
-        columns = self._get_random_columns(table, min_count=2, max_count=2)
-        col1 = columns[0]
-        col2 = columns[1]
-        
-        # Nested UNION, window functions, aggregates, and filtering
-        queries.append(f"""
+
+_SEGMENT_UNION_TEMPLATE = _compact_sql("""
         WITH 
         partitioned_data AS (
             SELECT {pk}, {col1}, {col2},
@@ -1925,6 +851,1518 @@ class SchemaQueryGenerator:
         )
         ORDER BY pd.segment, pd.{col1} DESC;
         """)
+
+# One-line query templates for _generate_function_queries, formatted with table and col
+_TEXT_FUNCTION_TEMPLATES = (
+    "SELECT UPPER({col}) FROM {table};",
+    "SELECT LOWER({col}) FROM {table};",
+    "SELECT LENGTH({col}) FROM {table};",
+    "SELECT SUBSTR({col}, 1, 3) FROM {table};",
+    "SELECT INSTR({col}, 'a') FROM {table};",
+    "SELECT REPLACE({col}, 'a', 'A') FROM {table};",
+    "SELECT TRIM({col}) FROM {table};",
+    "SELECT LTRIM(RTRIM({col})) FROM {table};",
+    "SELECT {col} || ' suffix' FROM {table};",
+)
+
+_NUMERIC_FUNCTION_TEMPLATES = (
+    "SELECT ABS({col}) FROM {table};",
+    "SELECT ROUND({col}, 2) FROM {table};",
+    "SELECT CEIL({col}) FROM {table};",
+    "SELECT FLOOR({col}) FROM {table};",
+    # Math expressions
+    "SELECT {col} + 10 FROM {table};",
+    "SELECT {col} * 2 FROM {table};",
+    "SELECT {col} / NULLIF(2, 0) FROM {table};",  # Prevent division by zero
+)
+
+_DATE_FUNCTION_TEMPLATES = (
+    "SELECT date({col}, '+1 day') FROM {table};",
+    "SELECT strftime('%Y-%m-%d', {col}) FROM {table};",
+    "SELECT datetime({col}, 'start of month') FROM {table};",
+)
+
+_NULL_FUNCTION_TEMPLATES = (
+    "SELECT COALESCE({col}, 'N/A') FROM {table};",
+    "SELECT NULLIF({col}, 'unknown') FROM {table};",
+    "SELECT IFNULL({col}, 0) FROM {table};",
+)
+
+_CAST_FUNCTION_TEMPLATES = (
+    "SELECT CAST({col} AS TEXT) FROM {table};",
+    "SELECT CAST({col} AS INTEGER) FROM {table};",
+    "SELECT CAST({col} AS REAL) FROM {table};",
+    "SELECT CAST(1 AS TEXT) FROM {table};",
+    "SELECT CAST(5.0 AS INTEGER) FROM {table};",
+    "SELECT CAST(20 AS REAL) FROM {table};",
+)
+
+# One-line window function templates for _generate_window_function_queries, formatted with table, pk and col
+_ORDERED_WINDOW_TEMPLATES = (
+    # Row numbering functions
+    "SELECT {pk}, {col}, ROW_NUMBER() OVER (ORDER BY {col}) as row_num FROM {table};",
+    "SELECT {pk}, {col}, RANK() OVER (ORDER BY {col}) as rank_val FROM {table};",
+    "SELECT {pk}, {col}, DENSE_RANK() OVER (ORDER BY {col}) as dense_rank_val FROM {table};",
+    # NTILE
+    "SELECT {pk}, {col}, NTILE(4) OVER (ORDER BY {col}) as quartile FROM {table};",
+    # Lead and lag
+    "SELECT {pk}, {col}, LAG({col}, 1) OVER (ORDER BY {pk}) as prev_val FROM {table};",
+    "SELECT {pk}, {col}, LEAD({col}, 1) OVER (ORDER BY {pk}) as next_val FROM {table};",
+    # First_value and last_value
+    "SELECT {pk}, {col}, FIRST_VALUE({col}) OVER (ORDER BY {pk}) as first_val FROM {table};",
+    "SELECT {pk}, {col}, LAST_VALUE({col}) OVER (ORDER BY {pk} RANGE BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING) as last_val FROM {table};",
+)
+
+# Fixed queries emitted by _generate_transaction_queries
+_TRANSACTION_TYPE_QUERIES = (
+    "BEGIN IMMEDIATE TRANSACTION; COMMIT;",
+    "BEGIN EXCLUSIVE TRANSACTION; COMMIT;",
+    "BEGIN DEFERRED TRANSACTION; COMMIT;",
+)
+
+_SAVEPOINT_QUERIES = (
+    "SAVEPOINT sp_name; RELEASE SAVEPOINT sp_name;",
+    "SAVEPOINT sp_name; ROLLBACK TO SAVEPOINT sp_name;",
+)
+
+# Fixed queries emitted by _generate_schema_queries
+_PRAGMA_SETTING_QUERIES = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA cache_size = 10000;",
+)
+
+# Fixed queries emitted by _generate_function_queries
+_SQLITE_FUNCTION_QUERIES = (
+    "SELECT quote('string''with quotes');",
+    "SELECT typeof(42), typeof('text'), typeof(3.14), typeof(NULL);",
+)
+
+# Fixed queries emitted by _generate_materialized_queries
+_MATERIALIZATION_HINT_QUERIES = (
+    # Example with explicit MATERIALIZED
+    _compact_sql("""
+            WITH t(a) AS MATERIALIZED (SELECT json('{"x": 10}'))
+            SELECT json_extract(a, '$.x') FROM t;
+        """),
+    # Multiple CTEs with different materialization strategies
+    _compact_sql("""
+            WITH 
+            t1(a) AS MATERIALIZED (SELECT 1),
+            t2(b) AS NOT MATERIALIZED (SELECT 2),
+            t3(c) AS (SELECT 3)
+            SELECT t1.a, t2.b, t3.c FROM t1, t2, t3;
+        """),
+)
+
+_MATERIALIZED_EXPRESSION_QUERIES = (
+    # JSON functions with NOT MATERIALIZED
+    _compact_sql("""
+            WITH 
+            json_data(doc) AS NOT MATERIALIZED (
+                SELECT json('{"id": 123, "values": [1, 2, 3], "nested": {"key": "value"}}')
+            ),
+            extracted(id, first_val, key_val) AS MATERIALIZED (
+                SELECT 
+                    json_extract(doc, '$.id'),
+                    json_extract(doc, '$.values[0]'),
+                    json_extract(doc, '$.nested.key')
+                FROM json_data
+            )
+            SELECT * FROM extracted;
+        """),
+    # Math functions with materialization
+    _compact_sql("""
+            WITH 
+            numbers(n) AS MATERIALIZED (
+                SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5
+            ),
+            calculations AS NOT MATERIALIZED (
+                SELECT 
+                    n,
+                    n*n as squared,
+                    pow(n, 3) as cubed,
+                    sqrt(n) as square_root
+                FROM numbers
+            )
+            SELECT * FROM calculations
+            ORDER BY n;
+        """),
+    # Date functions
+    _compact_sql("""
+            WITH 
+            dates(d) AS MATERIALIZED (
+                SELECT date('now') UNION ALL
+                SELECT date('now', '+1 day') UNION ALL
+                SELECT date('now', '+2 days') UNION ALL
+                SELECT date('now', '+1 month') UNION ALL
+                SELECT date('now', '+1 year')
+            ),
+            formatted AS NOT MATERIALIZED (
+                SELECT 
+                    d,
+                    strftime('%Y', d) as year,
+                    strftime('%m', d) as month,
+                    strftime('%d', d) as day
+                FROM dates
+            )
+            SELECT * FROM formatted;
+        """),
+    # Recursive CTE with materialization
+    _compact_sql("""
+            WITH RECURSIVE 
+            fibonacci(a, b) AS NOT MATERIALIZED (
+                SELECT 0, 1
+                UNION ALL
+                SELECT b, a+b FROM fibonacci
+                WHERE b < 100
+            )
+            SELECT a as fibonacci_number FROM fibonacci;
+        """),
+)
+
+def _random_date_literal() -> str:
+    """Random 2024 date literal, decoded from a single RNG draw."""
+    bits = random.getrandbits(64)
+    month = bits % 12 + 1
+    bits //= 12
+    day = bits % 28 + 1
+    return f"'2024-{month:02d}-{day:02d}'"
+
+def _random_datetime_literal() -> str:
+    """Random 2024 datetime literal, decoded from a single RNG draw."""
+    bits = random.getrandbits(64)
+    month = bits % 12 + 1
+    bits //= 12
+    day = bits % 28 + 1
+    bits //= 28
+    hour = bits % 24
+    bits //= 24
+    minute = bits % 60
+    bits //= 60
+    second = bits % 60
+    return f"'2024-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}'"
+
+class SchemaQueryGenerator:
+    """
+    Enhanced class to generate SQL queries covering most SQL features.
+    """
+    
+    # Column type classifiers (case-insensitive substring match on the declared type)
+    # "INT" subsumes INTEGER, TINYINT, SMALLINT, MEDIUMINT, BIGINT, UNSIGNED BIG INT,
+    # INT2 and INT8 (and "DOUBLE" subsumes DOUBLE PRECISION), so the most common
+    # numeric types are matched by the first alternative.
+    _NUMERIC_TYPE_RE = re.compile(r"INT|REAL|DOUBLE|FLOAT|NUMERIC|DECIMAL", re.IGNORECASE)
+    _TEXT_TYPE_RE = re.compile(
+        r"TEXT|CHARACTER|VARCHAR|VARYING CHARACTER|NCHAR|NATIVE CHARACTER|NVARCHAR|CLOB",
+        re.IGNORECASE
+    )
+    _DATE_TYPE_RE = re.compile(r"DATE", re.IGNORECASE)
+    
+    # Bit flags for the precomputed per-column type classification
+    _NUMERIC_FLAG = 1
+    _TEXT_FLAG = 2
+    _DATE_FLAG = 4
+    
+    # Query generators run by generate_queries, in emission order
+    _QUERY_GENERATORS = (
+        "_generate_select_queries",
+        "_generate_join_queries",
+        "_generate_aggregate_queries",
+        "_generate_subquery_queries",
+        "_generate_insert_queries",
+        "_generate_update_queries",
+        "_generate_delete_queries",
+        "_generate_order_limit_queries",
+        "_generate_case_queries",
+        "_generate_union_queries",
+        "_generate_view_queries",
+        "_generate_index_queries",
+        "_generate_transaction_queries",
+        "_generate_cte_queries",
+        "_generate_function_queries",
+        "_generate_window_function_queries",
+        "_generate_schema_queries",
+        "_generate_materialized_queries",
+        "_generate_nested_queries",
+    )
+    
+    # Literal generators keyed by the column kind from _classify_literal_kind
+    _LITERAL_GENERATORS = {
+        "int": lambda: str(random.randint(1, 100)),
+        "float": lambda: str(round(random.uniform(1.0, 100.0), 2)),
+        "text": lambda: f"'Example{random.randint(1, 100)}'",
+        "bool": lambda: random.choice(["0", "1"]),
+        "date": _random_date_literal,
+        "datetime": _random_datetime_literal,
+        "other": lambda: "'example'",
+    }
+    
+    def __init__(self, schema_path: str = "databases/schema_info.json"):
+        """
+        Initialize the query generator.
+        
+        Args:
+            schema_path: Path to the schema JSON file
+        """
+        self.schema_info: Dict[str, Dict[str, Any]] = self._load_schema(schema_path)
+        
+        # Partition tables and views in a single pass over the schema
+        self.table_names: List[str] = []
+        self.view_names: List[str] = []
+        for name, info in self.schema_info.items():
+            if info.get("is_view", False):
+                self.view_names.append(name)
+            else:
+                self.table_names.append(name)
+        
+        # Column names of every table as a flat tuple, read directly by the random pickers
+        self._column_names: Dict[str, Tuple[str, ...]] = {
+            name: tuple(info["column_names"]) for name, info in self.schema_info.items()
+        }
+        
+        # Position of every table in table_names, used to draw "any other table"
+        self._table_index: Dict[str, int] = {name: i for i, name in enumerate(self.table_names)}
+        
+        # Type flags of every column, used by the _is_*_column checks
+        self._column_type_flags: Dict[str, Dict[str, int]] = {
+            name: {col: self._classify_type_flags(col_type)
+                   for col, col_type in info["column_types"].items()}
+            for name, info in self.schema_info.items()
+        }
+        
+        # Whether any table has a numeric column; lets numeric-only branches bail out early
+        self._has_numeric_columns: bool = any(
+            flags & self._NUMERIC_FLAG
+            for name in self.table_names
+            for flags in self._column_type_flags[name].values()
+        )
         
-        return queries
+        # Comma-separated column lists already built by _join_columns
+        self._column_list_strs: Dict[Tuple[str, ...], str] = {}
+        
+        # Per-table text/numeric/date column lists, filled lazily by _get_column_groups
+        self._column_groups: Dict[str, Dict[str, List[str]]] = {}
+        
+        # Literal kind of every column, used by _get_literal_for_column
+        self._column_kinds: Dict[str, Dict[str, str]] = {
+            name: {col: self._classify_literal_kind(col_type)
+                   for col, col_type in info["column_types"].items()}
+            for name, info in self.schema_info.items()
+        }
+        
+        if not self.table_names:
+            raise ValueError("No tables found in schema information.")
+        
+        # Fully-qualified primary key ("table.pk") of every table, used by the JOIN queries
+        self._qualified_pks: Dict[str, str] = {
+            name: f"{name}.{self._get_primary_key_column(name)}"
+            for name in self.schema_info
+        }
+        
+        # Bind the query generators once instead of resolving them on every call
+        self._query_generators: Tuple[Callable[[], Iterator[str]], ...] = tuple(
+            getattr(self, name) for name in self._QUERY_GENERATORS)
+    
+    def _load_schema(self, schema_path: str) -> Dict[str, Any]:
+        """
+        Load schema information from JSON file.
+        
+        Args:
+            schema_path: Path to the schema JSON file
+            
+        Returns:
+            Dictionary with schema information
+        """
+        if not os.path.exists(schema_path):
+            raise FileNotFoundError(f"Schema file {schema_path} not found.")
+            
+        with open(schema_path, 'r') as f:
+            schema_info = json.load(f)
+        
+        return self._intern_schema(schema_info)
+    
+    @classmethod
+    def _intern_schema(cls, value: Any) -> Any:
+        """Recursively intern every string (keys and values) of the loaded schema."""
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, dict):
+            return {sys.intern(key): cls._intern_schema(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._intern_schema(item) for item in value]
+        return value
+    
+    def _get_random_table(self) -> str:
+        """Get a random table name from the schema."""
+        return random.choice(self.table_names)
+    
+    def _get_random_view(self) -> Optional[str]:
+        """Get a random view name from the schema."""
+        if not self.view_names:
+            return None
+        return random.choice(self.view_names)
+    
+    def _get_random_tables(self, count: int = 2) -> List[str]:
+        """Get multiple random table names from the schema."""
+        if count >= len(self.table_names):
+            return self.table_names.copy()
+        return random.sample(self.table_names, count)
+    
+    def _get_random_column(self, table_name: str) -> str:
+        """Get a random column name from the specified table."""
+        columns = self._column_names.get(table_name)
+        if columns is None:
+            raise ValueError(f"Table {table_name} not found in schema.")
+        
+        return random.choice(columns)
+    
+    def _get_random_columns(self, table_name: str, min_count: int = 1, max_count: Optional[int] = None) -> List[str]:
+        """Get random column names from the specified table."""
+        columns = self._column_names.get(table_name)
+        if columns is None:
+            raise ValueError(f"Table {table_name} not found in schema.")
+        
+        if max_count is None or max_count > len(columns):
+            max_count = len(columns)
+        if min_count > max_count:
+            min_count = max_count
+            
+        return self._pick_distinct_columns(table_name, random.randint(min_count, max_count))
+    
+    def _pick_distinct_columns(self, table_name: str, count: int) -> List[str]:
+        """
+        Get `count` distinct random column names from the specified table,
+        or all of its columns (in random order) if it has fewer than `count`.
+        """
+        columns = self._column_names.get(table_name)
+        if columns is None:
+            raise ValueError(f"Table {table_name} not found in schema.")
+        
+        # Partial Fisher-Yates shuffle of a copy: the first `count` slots become a uniform sample
+        picked = list(columns)
+        num_columns = len(picked)
+        count = min(count, num_columns)
+        for i in range(count):
+            j = random.randrange(i, num_columns)
+            picked[i], picked[j] = picked[j], picked[i]
+        
+        return picked[:count]
+    
+    def _join_columns(self, columns: List[str]) -> str:
+        """Join column names into a comma-separated list, reusing previously built lists."""
+        key = tuple(columns)
+        columns_str = self._column_list_strs.get(key)
+        if columns_str is None:
+            columns_str = self._column_list_strs[key] = ", ".join(columns)
+        return columns_str
+    
+    def _get_primary_key_column(self, table_name: str) -> str:
+        """Get the primary key column of the specified table."""
+        if table_name not in self.schema_info:
+            raise ValueError(f"Table {table_name} not found in schema.")
+            
+        # Assuming c0 is always the primary key
+        return "c0"
+    
+    def _get_random_index(self, table_name: str) -> Optional[str]:
+        """Get a random index name from the specified table."""
+        if table_name not in self.schema_info:
+            raise ValueError(f"Table {table_name} not found in schema.")
+            
+        indices = self.schema_info[table_name]["index_names"]
+        if not indices:
+            return None
+            
+        return random.choice(indices)
+    
+    def _get_column_type(self, table_name: str, column_name: str) -> str:
+        """Get the data type of a column."""
+        if table_name not in self.schema_info:
+            raise ValueError(f"Table {table_name} not found in schema.")
+            
+        if column_name not in self.schema_info[table_name]["column_types"]:
+            raise ValueError(f"Column {column_name} not found in table {table_name}.")
+            
+        return self.schema_info[table_name]["column_types"][column_name]
+    
+    @classmethod
+    def _classify_type_flags(cls, col_type: str) -> int:
+        """Compute the _*_FLAG bits describing a declared column type."""
+        flags = 0
+        if cls._NUMERIC_TYPE_RE.search(col_type):
+            flags |= cls._NUMERIC_FLAG
+        if cls._TEXT_TYPE_RE.search(col_type):
+            flags |= cls._TEXT_FLAG
+        if cls._DATE_TYPE_RE.search(col_type):
+            flags |= cls._DATE_FLAG
+        return flags
+    
+    def _get_column_type_flags(self, table_name: str, column_name: str) -> int:
+        """Get the precomputed type flags of a column."""
+        if table_name not in self._column_type_flags:
+            raise ValueError(f"Table {table_name} not found in schema.")
+        
+        flags = self._column_type_flags[table_name]
+        if column_name not in flags:
+            raise ValueError(f"Column {column_name} not found in table {table_name}.")
+        
+        return flags[column_name]
+    
+    def _is_numeric_column(self, table_name: str, column_name: str) -> bool:
+        """Check if the column is numeric."""
+        return bool(self._get_column_type_flags(table_name, column_name) & self._NUMERIC_FLAG)
+    
+    def _is_text_column(self, table_name: str, column_name: str) -> bool:
+        """Check if the column is text."""
+        return bool(self._get_column_type_flags(table_name, column_name) & self._TEXT_FLAG)
+    
+    def _is_date_column(self, table_name: str, column_name: str) -> bool:
+        """Check if the column is a date or datetime."""
+        return bool(self._get_column_type_flags(table_name, column_name) & self._DATE_FLAG)
+    
+    def _get_column_groups(self, table_name: str) -> Dict[str, List[str]]:
+        """Get the text, numeric and date columns of a table, classifying them on first use."""
+        groups = self._column_groups.get(table_name)
+        if groups is None:
+            type_flags = self._column_type_flags.get(table_name)
+            if type_flags is None:
+                raise ValueError(f"Table {table_name} not found in schema.")
+            
+            text_columns = []
+            numeric_columns = []
+            date_columns = []
+            
+            # Single pass over the columns, in column_names order
+            for col in self._column_names[table_name]:
+                flags = type_flags[col]
+                if flags & self._TEXT_FLAG:
+                    text_columns.append(col)
+                if flags & self._NUMERIC_FLAG:
+                    numeric_columns.append(col)
+                if flags & self._DATE_FLAG:
+                    date_columns.append(col)
+            
+            groups = {"text": text_columns, "numeric": numeric_columns, "date": date_columns}
+            self._column_groups[table_name] = groups
+        
+        return groups
+    
+    @staticmethod
+    def _classify_literal_kind(col_type: str) -> str:
+        """Map a declared column type to a key of _LITERAL_GENERATORS."""
+        col_type = col_type.upper()
+        
+        # Integer types
+        if any(int_type in col_type for int_type in ["INTEGER", "INT", "TINYINT", "SMALLINT", "MEDIUMINT", "BIGINT"]):
+            return "int"
+        
+        # Float types
+        elif any(float_type in col_type for float_type in ["REAL", "DOUBLE", "FLOAT", "NUMERIC", "DECIMAL"]):
+            return "float"
+        
+        # Text types
+        elif any(text_type in col_type for text_type in ["TEXT", "CHARACTER", "VARCHAR", "VARYING CHARACTER", "NCHAR", "CLOB"]):
+            return "text"
+        
+        # Boolean
+        elif "BOOLEAN" in col_type:
+            return "bool"
+        
+        # Date
+        elif "DATE" in col_type and "TIME" not in col_type:
+            return "date"
+        
+        # DateTime
+        elif "DATETIME" in col_type:
+            return "datetime"
+        
+        # Default
+        else:
+            return "other"
+    
+    @staticmethod
+    def _random_suffixes(count: int) -> Iterator[int]:
+        """Yield `count` uniform random object-name suffixes in [1, 1000], decoded from 10-bit windows of few RNG draws."""
+        windows = 0
+        while count:
+            if not windows:
+                windows = count
+                bits = random.getrandbits(10 * windows)
+            window = bits & 1023
+            bits >>= 10
+            windows -= 1
+            
+            # Reject windows 1000-1023, so that no suffix is more likely than the others
+            if window < 1000:
+                count -= 1
+                yield window + 1
+    
+    def _get_literal_for_column(self, table_name: str, column_name: str) -> str:
+        """Get a literal value appropriate for the column's data type."""
+        if table_name not in self._column_kinds:
+            raise ValueError(f"Table {table_name} not found in schema.")
+        
+        kinds = self._column_kinds[table_name]
+        if column_name not in kinds:
+            raise ValueError(f"Column {column_name} not found in table {table_name}.")
+        
+        return self._LITERAL_GENERATORS[kinds[column_name]]()
+    
+    def iter_queries(self) -> Iterator[str]:
+        """
+        Lazily generate SQL queries covering most SQL features.
+        
+        Queries are produced one at a time as they are consumed, so callers
+        that read them once should prefer this over generate_queries.
+        
+        Yields:
+            Valid SQL queries
+        """
+        yield "SELECT 1;" # Add dummy query to ensure that the energy assertion in the schedule class will not fail (division by zero because of empty seed)
+        
+        # Add queries for each category
+        for generate in self._query_generators:
+            yield from generate()
+    
+    def generate_queries(self) -> List[str]:
+        """
+        Generate SQL queries covering most SQL features.
+        
+        Returns:
+            List of valid SQL queries
+        """
+        return list(self.iter_queries())
+    
+    def _generate_select_queries(self) -> Iterator[str]:
+        """Generate basic SELECT queries."""
+        get_random_table = self._get_random_table
+        get_random_column = self._get_random_column
+        is_numeric_column = self._is_numeric_column
+        is_text_column = self._is_text_column
+        
+        # Basic SELECT queries
+        for _ in range(3):
+            table = get_random_table()
+            # SELECT *
+            yield f"SELECT * FROM {table};"
+            
+            # SELECT specific columns
+            columns = self._get_random_columns(table, min_count=2, max_count=4)
+            columns_str = self._join_columns(columns)
+            yield f"SELECT {columns_str} FROM {table};"
+            
+            # SELECT with WHERE
+            column = get_random_column(table)
+            if is_numeric_column(table, column):
+                yield f"SELECT * FROM {table} WHERE {column} > {random.randint(1, 50)};"
+            elif is_text_column(table, column):
+                yield f"SELECT * FROM {table} WHERE {column} LIKE 'A%';"
+            else:
+                yield f"SELECT * FROM {table} WHERE {column} IS NOT NULL;"
+            
+            # SELECT with WHERE conditions
+            columns = self._pick_distinct_columns(table, 2)
+            if len(columns) == 2:
+                column1, column2 = columns
+                yield f"SELECT * FROM {table} WHERE {column1} IS NOT NULL AND {column2} IS NOT NULL;"
+                yield f"SELECT * FROM {table} WHERE {column1} IS NULL OR {column2} IS NULL;"
+            
+            # SELECT DISTINCT
+            column = get_random_column(table)
+            yield f"SELECT DISTINCT {column} FROM {table};"
+    
+    def _generate_join_queries(self) -> Iterator[str]:
+        """Generate JOIN queries, including complex and unusual join patterns."""
+        # Make sure we have at least 2 tables
+        n_tables = len(self.table_names)
+        if n_tables < 2:
+            return
+        
+        qualified_pks = self._qualified_pks
+        
+        # --- Standard JOIN queries  ---
+        for _ in range(3):
+            # Get two random tables
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            qualified_pk1 = qualified_pks[table1]
+            qualified_pk2 = qualified_pks[table2]
+            
+            # Basic INNER JOIN
+            yield f"SELECT {qualified_pk1}, {qualified_pk2} FROM {table1} JOIN {table2} ON {qualified_pk1} = {qualified_pk2};"
+            
+            # LEFT JOIN
+            yield f"SELECT * FROM {table1} LEFT JOIN {table2};"
+            yield f"SELECT {qualified_pk1}, {qualified_pk2} FROM {table1} LEFT JOIN {table2} ON {qualified_pk1} = {qualified_pk2};"
+            
+            # Complex JOIN with table aliases
+            col1 = self._get_random_column(table1)
+            col2 = self._get_random_column(table2)
+            yield f"SELECT a.{pk1}, a.{col1}, b.{pk2}, b.{col2} FROM {table1} a JOIN {table2} b ON a.{pk1} = b.{pk2};"
+        
+        # If we have 3 or more tables
+        if n_tables >= 3:
+            # Get three random tables
+            table1, table2, table3 = self._get_random_tables(3)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            pk3 = self._get_primary_key_column(table3)
+            
+            # Complex multi-table JOIN
+            yield _MULTI_TABLE_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3)
+            
+            # Multi-table JOIN with different join types
+            yield _MIXED_MULTI_TABLE_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3)
+        
+        # Self JOIN
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        yield f"SELECT a.{pk}, b.{pk} FROM {table} a, {table} b WHERE a.{pk} < b.{pk} AND a.{col} = b.{col};"
+        
+        # Cross JOIN
+        table1, table2 = self._get_random_tables(2)
+        yield f"SELECT * FROM {table1} CROSS JOIN {table2};"
+        
+        # --- More complex JOIN queries ---
+        # Weird chained JOIN pattern
+        if n_tables >= 3:
+            table1, table2, table3 = self._get_random_tables(3)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            pk3 = self._get_primary_key_column(table3)
+            col1 = self._get_random_column(table1)
+            
+            # Chained JOIN with mixed types and no explicit ON clause for the last join
+            yield _CHAINED_OUTER_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3, col1=col1)
+            
+            # Another weird join pattern with multiple conditions
+            yield _MULTI_CONDITION_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3, col1=col1)
+        
+        # Complex JOIN with a view if available
+        if self.view_names and n_tables >= 2:
+            view = self._get_random_view()
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            view_col = self._get_random_column(view)
+            
+            # Join with a view
+            yield _VIEW_JOIN_TEMPLATE.format(table1=table1, table2=table2, view=view, pk1=pk1, pk2=pk2, view_col=view_col)
+        
+        # NATURAL JOIN
+        if n_tables >= 2:
+            table1, table2 = self._get_random_tables(2)
+            yield f"SELECT * FROM {table1} NATURAL JOIN {table2};"
+            yield f"SELECT * FROM {table1} NATURAL LEFT JOIN {table2};"
+        
+        # JOIN with USING clause
+        if n_tables >= 2:
+            table1, table2 = self._get_random_tables(2)
+            pk = self._get_primary_key_column(table1)  # Assuming same PK name
+            yield f"SELECT * FROM {table1} JOIN {table2} USING ({pk});"
+        
+        # Complex multi-level JOIN structure
+        if n_tables >= 4:
+            tables = self._get_random_tables(4)
+            pks = [self._get_primary_key_column(t) for t in tables]
+            
+            yield _NESTED_FOUR_TABLE_JOIN_TEMPLATE.format(tables=tables, pks=pks)
+        
+        # JOIN with a derived table/subquery
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        
+        yield _DERIVED_TABLE_JOIN_TEMPLATE.format(table=table, pk=pk, col=col)
+        
+        # JOIN with CASE expression in the ON clause
+        if n_tables >= 2:
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            col1 = self._get_random_column(table1)
+            col2 = self._get_random_column(table2)
+            
+            yield _CASE_ON_JOIN_TEMPLATE.format(table1=table1, table2=table2, pk1=pk1, pk2=pk2, col1=col1, col2=col2)
+        
+        # Multiple chained JOINs with mixed styles and complex conditions
+        if n_tables >= 3:
+            table1, table2, table3 = self._get_random_tables(3)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            pk3 = self._get_primary_key_column(table3)
+            col1 = self._get_random_column(table1)
+            col2 = self._get_random_column(table2)
+            col3 = self._get_random_column(table3)
+            view = self._get_random_view()
+            
+            # Extremely complex nested JOIN structure
+            yield _EXTREME_NESTED_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3, col1=col1, col2=col2, col3=col3)
+            
+            # JOIN chain with lateral join-like pattern
+            yield _LATERAL_LIKE_JOIN_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3, col1=col1, col2=col2, col3=col3)
+
+            yield _VIEW_RIGHT_JOIN_TEMPLATE.format(table1=table1, table2=table2, view=view, col1=col1)
+    
+    def _generate_aggregate_queries(self) -> Iterator[str]:
+        """Generate aggregate and GROUP BY queries."""
+        # Every query below needs a numeric column
+        if not self._has_numeric_columns:
+            return
+        
+        get_column_groups = self._get_column_groups
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            
+            # Find a numeric column for aggregations
+            numeric_columns = get_column_groups(table)["numeric"]
+            
+            if numeric_columns:
+                numeric_col = random.choice(numeric_columns)
+                
+                # Simple aggregation
+                yield f"SELECT COUNT(*) FROM {table};"
+                yield f"SELECT COUNT({numeric_col}) FROM {table};"
+                yield f"SELECT SUM({numeric_col}) FROM {table};"
+                yield f"SELECT AVG({numeric_col}) FROM {table};"
+                yield f"SELECT MIN({numeric_col}), MAX({numeric_col}) FROM {table};"
+                
+                # GROUP BY
+                group_col = self._get_random_column(table)
+                if group_col != numeric_col:
+                    yield f"SELECT {group_col}, COUNT(*) FROM {table} GROUP BY {group_col};"
+                    yield f"SELECT {group_col}, SUM({numeric_col}) FROM {table} GROUP BY {group_col};"
+                    yield f"SELECT {group_col}, AVG({numeric_col}) FROM {table} GROUP BY {group_col};"
+                    
+                    # With HAVING
+                    yield f"SELECT {group_col}, COUNT(*) FROM {table} GROUP BY {group_col} HAVING COUNT(*) > 1;"
+                    yield f"SELECT {group_col}, SUM({numeric_col}) FROM {table} GROUP BY {group_col} HAVING SUM({numeric_col}) > 10;"
+    
+    def _generate_subquery_queries(self) -> Iterator[str]:
+        """Generate queries with subqueries."""
+        get_random_table = self._get_random_table
+        get_primary_key_column = self._get_primary_key_column
+        has_multiple_tables = len(self.table_names) >= 2
+        
+        for _ in range(3):
+            table = get_random_table()
+            pk = get_primary_key_column(table)
+            col = self._get_random_column(table)
+            
+            # Simple subquery in WHERE
+            yield f"SELECT * FROM {table} WHERE {pk} IN (SELECT {pk} FROM {table} WHERE {col} IS NOT NULL);"
+            
+            # Subquery with comparison
+            if self._is_numeric_column(table, col):
+                yield f"SELECT * FROM {table} WHERE {col} > (SELECT AVG({col}) FROM {table});"
+            
+            # Subquery in SELECT
+            yield f"SELECT {pk}, (SELECT COUNT(*) FROM {table} t2 WHERE t2.{pk} <= {table}.{pk}) AS count_less_equal FROM {table};"
+            
+            # EXISTS subquery
+            yield f"SELECT * FROM {table} t1 WHERE EXISTS (SELECT 1 FROM {table} t2 WHERE t2.{pk} = t1.{pk});"
+            
+            # NOT EXISTS subquery
+            yield f"SELECT * FROM {table} t1 WHERE NOT EXISTS (SELECT 1 FROM {table} t2 WHERE t2.{pk} > t1.{pk});"
+            
+            # Subquery in FROM
+            yield f"SELECT sub.{pk}, sub.{col} FROM (SELECT {pk}, {col} FROM {table} WHERE {col} IS NOT NULL) sub;"
+            
+            # Correlated subquery
+            if has_multiple_tables:
+                # Draw from the other N-1 tables by skipping over the current one
+                idx = random.randrange(len(self.table_names) - 1)
+                idx += idx >= self._table_index[table]
+                table2 = self.table_names[idx]
+                pk2 = get_primary_key_column(table2)
+                yield f"SELECT t1.{pk}, (SELECT COUNT(*) FROM {table2} t2 WHERE t2.{pk2} = t1.{pk}) FROM {table} t1;"
+        
+        # ALL, ANY, SOME subqueries
+        table = get_random_table()
+        col = self._get_random_column(table)
+        if self._is_numeric_column(table, col):
+            yield f"SELECT * FROM {table} WHERE {col} > ALL (SELECT {col} FROM {table} WHERE {pk} < 5);"
+            yield f"SELECT * FROM {table} WHERE {col} > ANY (SELECT {col} FROM {table} WHERE {pk} < 5);"
+            yield f"SELECT * FROM {table} WHERE {col} > SOME (SELECT {col} FROM {table} WHERE {pk} < 5);"
+    
+    def _generate_insert_queries(self) -> Iterator[str]:
+        """Generate INSERT queries."""
+        get_literal_for_column = self._get_literal_for_column
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            columns = self._get_random_columns(table, min_count=2, max_count=4)
+            columns_str = self._join_columns(columns)
+            
+            # Generate appropriate values
+            values_str = ", ".join([get_literal_for_column(table, col) for col in columns])
+            
+            # Basic INSERT
+            yield f"INSERT INTO {table} ({columns_str}) VALUES ({values_str});"
+            
+            # Multiple row INSERT
+            values2_str = ", ".join([get_literal_for_column(table, col) for col in columns])
+            
+            yield f"INSERT INTO {table} ({columns_str}) VALUES ({values_str}), ({values2_str});"
+            
+            # INSERT OR REPLACE
+            yield f"INSERT OR REPLACE INTO {table} ({columns_str}) VALUES ({values_str});"
+            
+            # INSERT OR IGNORE
+            yield f"INSERT OR IGNORE INTO {table} ({columns_str}) VALUES ({values_str});"
+            
+            # INSERT with SELECT
+            yield f"INSERT INTO {table} ({columns_str}) SELECT {columns_str} FROM {table} LIMIT 1;"
+        
+        # INSERT with RETURNING
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        yield f"INSERT INTO {table} ({pk}, {col}) VALUES (999, {self._get_literal_for_column(table, col)}) RETURNING {pk}, {col};"
+        
+        # INSERT with ON CONFLICT
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        if self._is_numeric_column(table, col):
+            yield f"INSERT INTO {table} ({pk}, {col}) VALUES (1, 100) ON CONFLICT({pk}) DO UPDATE SET {col} = {col} + 1;"
+            yield f"INSERT INTO {table} ({pk}, {col}) VALUES (1, 100) ON CONFLICT({pk}) DO NOTHING;"
+    
+    def _generate_update_queries(self) -> Iterator[str]:
+        """Generate UPDATE queries."""
+        get_literal_for_column = self._get_literal_for_column
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            col = self._get_random_column(table)
+            is_numeric = self._is_numeric_column(table, col)
+            
+            # Basic UPDATE
+            yield f"UPDATE {table} SET {col} = {get_literal_for_column(table, col)} WHERE {pk} = 1;"
+            
+            # Update with expressions
+            if is_numeric:
+                yield f"UPDATE {table} SET {col} = {col} + 10 WHERE {pk} > 0;"
+                yield f"UPDATE {table} SET {col} = {col} * 2 WHERE {pk} > 0;"
+            
+            # Update with NULL
+            yield f"UPDATE {table} SET {col} = NULL WHERE {pk} = 2;"
+            
+            # Update with CASE
+            if is_numeric:
+                yield _CASE_UPDATE_TEMPLATE.format(table=table, pk=pk, col=col)
+            
+            # Update with subquery
+            yield f"UPDATE {table} SET {col} = (SELECT {col} FROM {table} WHERE {pk} = 1) WHERE {pk} = 2;"
+        
+        # UPDATE with RETURNING
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        yield f"UPDATE {table} SET {col} = {get_literal_for_column(table, col)} WHERE {pk} = 1 RETURNING {pk}, {col};"
+        
+        # UPDATE multiple columns
+        table = self._get_random_table()
+        columns = self._get_random_columns(table, min_count=2, max_count=3)
+        set_clauses = []
+        for col in columns:
+            set_clauses.append(f"{col} = {get_literal_for_column(table, col)}")
+        set_str = ", ".join(set_clauses)
+        
+        yield f"UPDATE {table} SET {set_str} WHERE {pk} = 1;"
+        
+        # UPDATE with OR
+        yield f"UPDATE OR IGNORE {table} SET {col} = {get_literal_for_column(table, col)};"
+        
+        # UPDATE with ORDER BY and LIMIT
+        yield f"UPDATE {table} SET {col} = {get_literal_for_column(table, col)} ORDER BY {pk} DESC LIMIT 5;"
+    
+    def _generate_delete_queries(self) -> Iterator[str]:
+        """Generate DELETE queries."""
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            col = self._get_random_column(table)
+            
+            # Basic DELETE
+            yield f"DELETE FROM {table} WHERE {pk} = 1;"
+            
+            # DELETE with complex condition
+            yield f"DELETE FROM {table} WHERE {pk} > 10 AND {col} IS NOT NULL;"
+            
+            # DELETE all rows
+            yield f"DELETE FROM {table};"
+            
+            # DELETE with subquery
+            yield f"DELETE FROM {table} WHERE {pk} IN (SELECT {pk} FROM {table} WHERE {col} IS NULL);"
+        
+        # DELETE with ORDER BY and LIMIT
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        yield f"DELETE FROM {table} ORDER BY {pk} DESC LIMIT 5;"
+    
+    def _generate_order_limit_queries(self) -> Iterator[str]:
+        """Generate queries with ORDER BY and LIMIT."""
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            columns = self._pick_distinct_columns(table, 2)
+            col = columns[0]
+            
+            # ORDER BY ASC
+            yield f"SELECT * FROM {table} ORDER BY {col} ASC;"
+            
+            # ORDER BY DESC
+            yield f"SELECT * FROM {table} ORDER BY {col} DESC;"
+            
+            # ORDER BY multiple columns
+            if len(columns) == 2:
+                col2 = columns[1]
+                yield f"SELECT * FROM {table} ORDER BY {col} ASC, {col2} DESC;"
+            
+            # LIMIT
+            yield f"SELECT * FROM {table} LIMIT 10;"
+            
+            # LIMIT with OFFSET
+            yield f"SELECT * FROM {table} LIMIT 5 OFFSET 5;"
+            
+            # ORDER BY with LIMIT
+            yield f"SELECT * FROM {table} ORDER BY {col} DESC LIMIT 10;"
+            
+            # ORDER BY with NULLS FIRST/LAST
+            yield f"SELECT * FROM {table} ORDER BY {col} NULLS FIRST;"
+            yield f"SELECT * FROM {table} ORDER BY {col} NULLS LAST;"
+            
+            # ORDER BY with COLLATE
+            if self._is_text_column(table, col):
+                yield f"SELECT * FROM {table} ORDER BY {col} COLLATE NOCASE;"
+    
+    def _generate_case_queries(self) -> Iterator[str]:
+        """Generate queries with CASE expressions."""
+        has_numeric_columns = self._has_numeric_columns
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            col = self._get_random_column(table)
+            
+            # Simple CASE
+            if has_numeric_columns and self._is_numeric_column(table, col):
+                yield _SIMPLE_CASE_TEMPLATE.format(table=table, pk=pk, col=col)
+            
+            # Searched CASE
+            yield _SEARCHED_CASE_TEMPLATE.format(table=table, pk=pk, col=col)
+            
+            # CASE in ORDER BY
+            yield _CASE_ORDER_BY_TEMPLATE.format(table=table, pk=pk, col=col)
+        
+        # CASE in UPDATE
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        if has_numeric_columns and self._is_numeric_column(table, col):
+            yield _CASE_UPDATE_TEMPLATE.format(table=table, pk=pk, col=col)
+    
+    def _generate_union_queries(self) -> Iterator[str]:
+        """Generate UNION, EXCEPT, INTERSECT queries."""
+        # Make sure we have at least 2 tables
+        if len(self.table_names) < 2:
+            return
+        
+        for _ in range(2):
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            
+            # UNION
+            yield f"SELECT {pk1} FROM {table1} UNION SELECT {pk2} FROM {table2};"
+            
+            # UNION ALL
+            yield f"SELECT {pk1} FROM {table1} UNION ALL SELECT {pk2} FROM {table2};"
+            
+            # EXCEPT
+            yield f"SELECT {pk1} FROM {table1} EXCEPT SELECT {pk2} FROM {table2};"
+            
+            # INTERSECT
+            yield f"SELECT {pk1} FROM {table1} INTERSECT SELECT {pk2} FROM {table2};"
+        
+        # Complex UNION with subqueries
+        if len(self.table_names) >= 2:
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            
+            yield _UNION_SUBQUERY_TEMPLATE.format(table1=table1, table2=table2, pk1=pk1, pk2=pk2)
+    
+    def _generate_view_queries(self) -> Iterator[str]:
+        """Generate queries for views."""
+        suffixes = self._random_suffixes(6)
+        
+        for _ in range(2):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            columns = self._get_random_columns(table, min_count=2, max_count=3)
+            columns_str = self._join_columns(columns)
+            
+            # CREATE VIEW
+            view_name = f"v_{table}_{next(suffixes)}"
+            yield f"CREATE VIEW {view_name} AS SELECT {columns_str} FROM {table};"
+            
+            # CREATE TEMPORARY VIEW
+            temp_view_name = f"temp_v_{table}_{next(suffixes)}"
+            yield f"CREATE TEMPORARY VIEW {temp_view_name} AS SELECT {columns_str} FROM {table};"
+            
+            # DROP VIEW
+            yield f"DROP VIEW IF EXISTS {view_name};"
+            
+            # Create view with complex query
+            complex_view_name = f"complex_v_{table}_{next(suffixes)}"
+            col = columns[0]
+            yield _COMPLEX_VIEW_TEMPLATE.format(table=table, complex_view_name=complex_view_name, pk=pk, col=col)
+        
+        # Use existing views in queries, one batch of each query shape
+        view_names = self.view_names
+        view_cols = [self._get_random_column(view_name) for view_name in view_names]
+        yield from [f"SELECT * FROM {view_name};" for view_name in view_names]
+        yield from [f"SELECT {col} FROM {view_name} WHERE {col} IS NOT NULL;"
+                    for view_name, col in zip(view_names, view_cols)]
+        
+        # Join view with table
+        if self.table_names:
+            tables = [self._get_random_table() for _ in view_names]
+            pks = [self._get_primary_key_column(table) for table in tables]
+            yield from [f"SELECT v.{col}, t.{pk} FROM {view_name} v JOIN {table} t ON v.{col} = t.{pk};"
+                        for view_name, col, table, pk in zip(view_names, view_cols, tables, pks)]
+    
+    def _generate_index_queries(self) -> Iterator[str]:
+        """Generate queries for indexes."""
+        suffixes = self._random_suffixes(10)
+        
+        for _ in range(2):
+            table = self._get_random_table()
+            columns = self._pick_distinct_columns(table, 2)
+            column = columns[0]
+            
+            # CREATE INDEX
+            index_name = f"idx_{table}_{column}_{next(suffixes)}"
+            yield f"CREATE INDEX {index_name} ON {table}({column});"
+            
+            # CREATE UNIQUE INDEX
+            unique_index_name = f"uix_{table}_{column}_{next(suffixes)}"
+            yield f"CREATE UNIQUE INDEX {unique_index_name} ON {table}({column});"
+            
+            # CREATE INDEX IF NOT EXISTS
+            yield f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column});"
+            
+            # DROP INDEX
+            yield f"DROP INDEX IF EXISTS {index_name};"
+            
+            # CREATE INDEX with multiple columns
+            if len(columns) == 2:
+                col2 = columns[1]
+                multi_index_name = f"idx_{table}_{column}_{col2}_{next(suffixes)}"
+                yield f"CREATE INDEX {multi_index_name} ON {table}({column}, {col2});"
+            
+            # CREATE INDEX with WHERE clause
+            where_index_name = f"idx_{table}_{column}_where_{next(suffixes)}"
+            yield f"CREATE INDEX {where_index_name} ON {table}({column}) WHERE {column} IS NOT NULL;"
+            
+            # CREATE INDEX with COLLATE
+            if self._is_text_column(table, column):
+                collate_index_name = f"idx_{table}_{column}_collate_{next(suffixes)}"
+                yield f"CREATE INDEX {collate_index_name} ON {table}({column} COLLATE NOCASE);"
+        
+        # REINDEX
+        table = self._get_random_table()
+        yield f"REINDEX {table};"
+        
+        # REINDEX a specific index
+        index = self._get_random_index(table)
+        if index:
+            yield f"REINDEX {index};"
+    
+    def _generate_transaction_queries(self) -> Iterator[str]:
+        """Generate transaction queries."""
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        
+        # One literal for all the UPDATEs and a separate one for the re-INSERT
+        literal = self._get_literal_for_column(table, col)
+        insert_literal = self._get_literal_for_column(table, col)
+        
+        # Basic transaction
+        yield _BASIC_TRANSACTION_TEMPLATE.format(table=table, pk=pk, col=col, literal=literal)
+        
+        # Transaction with ROLLBACK
+        yield _ROLLBACK_TRANSACTION_TEMPLATE.format(table=table, pk=pk, col=col, literal=literal)
+        
+        # Transaction with SAVEPOINT
+        yield _SAVEPOINT_TRANSACTION_TEMPLATE.format(table=table, pk=pk, col=col, literal=literal)
+        
+        # Various transaction types
+        yield from _TRANSACTION_TYPE_QUERIES
+        
+        # Transaction with multiple operations
+        yield _DELETE_INSERT_TRANSACTION_TEMPLATE.format(table=table, pk=pk, col=col, insert_literal=insert_literal)
+        
+        # SAVEPOINT operations
+        yield from _SAVEPOINT_QUERIES
+    
+    def _generate_cte_queries(self) -> Iterator[str]:
+        """Generate queries with Common Table Expressions (WITH clause)."""
+        has_numeric_columns = self._has_numeric_columns
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            columns = self._pick_distinct_columns(table, 2)
+            col = columns[0]
+            
+            # Simple WITH clause
+            yield _SIMPLE_CTE_TEMPLATE.format(table=table, pk=pk, col=col)
+            
+            # Multiple CTEs
+            if len(columns) == 2:
+                yield _MULTIPLE_CTE_TEMPLATE.format(table=table, pk=pk, col=col, col2=columns[1])
+            
+            # WITH clause with aggregation
+            if has_numeric_columns and self._is_numeric_column(table, col):
+                yield _AGGREGATE_CTE_TEMPLATE.format(table=table, col=col)
+        
+        # WITH RECURSIVE
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        yield _RECURSIVE_CTE_QUERY
+        
+        # Complex WITH clause
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        col = self._get_random_column(table)
+        yield _RANKED_CTE_TEMPLATE.format(table=table, pk=pk, col=col)
+    
+    def _generate_function_queries(self) -> Iterator[str]:
+        """Generate queries with SQL functions."""
+        for _ in range(3):
+            table = self._get_random_table()
+            column_groups = self._get_column_groups(table)
+            
+            # String functions
+            text_columns = column_groups["text"]
+            
+            if text_columns:
+                col = random.choice(text_columns)
+                yield from (template.format(table=table, col=col) for template in _TEXT_FUNCTION_TEMPLATES)
+            
+            # Numeric functions
+            num_columns = column_groups["numeric"]
+            
+            if num_columns:
+                col = random.choice(num_columns)
+                yield from (template.format(table=table, col=col) for template in _NUMERIC_FUNCTION_TEMPLATES)
+            
+            # Date functions
+            date_columns = column_groups["date"]
+            
+            if date_columns:
+                col = random.choice(date_columns)
+                yield from (template.format(table=table, col=col) for template in _DATE_FUNCTION_TEMPLATES)
+            
+            # NULL handling
+            col = self._get_random_column(table)
+            yield from (template.format(table=table, col=col) for template in _NULL_FUNCTION_TEMPLATES)
+        
+        # SQLite-specific functions
+        # queries.append("SELECT random();")
+        yield from _SQLITE_FUNCTION_QUERIES
+        
+        # Type casting
+        table = self._get_random_table()
+        col = self._get_random_column(table)
+        yield from (template.format(table=table, col=col) for template in _CAST_FUNCTION_TEMPLATES)
+    
+    def _generate_window_function_queries(self) -> Iterator[str]:
+        """Generate queries with window functions."""
+        # Every query below needs a numeric column
+        if not self._has_numeric_columns:
+            return
+        
+        get_column_groups = self._get_column_groups
+        
+        for _ in range(3):
+            table = self._get_random_table()
+            pk = self._get_primary_key_column(table)
+            
+            # Find a numeric column for window functions
+            numeric_columns = get_column_groups(table)["numeric"]
+            
+            if numeric_columns:
+                col = random.choice(numeric_columns)
+                
+                # Basic window function
+                yield f"SELECT {pk}, {col}, AVG({col}) OVER () as avg_total FROM {table};"
+                
+                # Window function with PARTITION BY
+                partition_col = self._get_random_column(table)
+                if partition_col != col:
+                    yield f"SELECT {pk}, {partition_col}, {col}, AVG({col}) OVER (PARTITION BY {partition_col}) as avg_by_group FROM {table};"
+                
+                # Window function with ORDER BY
+                yield f"SELECT {pk}, {col}, SUM({col}) OVER (ORDER BY {pk}) as running_sum FROM {table};"
+                
+                # Window function with both PARTITION BY and ORDER BY
+                if partition_col != col:
+                    yield f"SELECT {pk}, {partition_col}, {col}, SUM({col}) OVER (PARTITION BY {partition_col} ORDER BY {pk}) as running_sum_by_group FROM {table};"
+                
+                # Ranking, offset and value window functions
+                yield from (template.format(table=table, pk=pk, col=col) for template in _ORDERED_WINDOW_TEMPLATES)
+    
+    def _generate_schema_queries(self) -> Iterator[str]:
+        """Generate schema alteration queries."""
+        suffixes = self._random_suffixes(6)
+        
+        # CREATE TABLE
+        new_table_name = f"new_table_{next(suffixes)}"
+        yield _CREATE_TABLE_TEMPLATE.format(new_table_name=new_table_name)
+        
+        # CREATE TABLE IF NOT EXISTS
+        yield _CREATE_TABLE_IF_NOT_EXISTS_TEMPLATE.format(new_table_name=new_table_name)
+        
+        # CREATE TEMPORARY TABLE
+        temp_table_name = f"temp_table_{next(suffixes)}"
+        yield _CREATE_TEMP_TABLE_TEMPLATE.format(temp_table_name=temp_table_name)
+        
+        # DROP TABLE
+        yield f"DROP TABLE IF EXISTS {new_table_name};"
+        
+        # ALTER TABLE statements
+        table = self._get_random_table()
+        
+        # ALTER TABLE ADD COLUMN
+        yield f"ALTER TABLE {table} ADD COLUMN new_col TEXT;"
+        
+        # ALTER TABLE RENAME TO
+        yield f"ALTER TABLE {table} RENAME TO {table}_renamed;"
+        
+        # ALTER TABLE RENAME COLUMN
+        col = self._get_random_column(table)
+        yield f"ALTER TABLE {table} RENAME COLUMN {col} TO {col}_renamed;"
+        
+        # CREATE TABLE with constraints
+        constraints_table = f"constraints_table_{next(suffixes)}"
+        yield _CONSTRAINTS_TABLE_TEMPLATE.format(constraints_table=constraints_table)
+        
+        # CREATE TABLE with foreign key
+        if self.table_names:
+            fk_table = self._get_random_table()
+            fk_col = self._get_primary_key_column(fk_table)
+            fk_ref_table = f"fk_table_{next(suffixes)}"
+            yield _FOREIGN_KEY_TABLE_TEMPLATE.format(fk_table=fk_table, fk_ref_table=fk_ref_table, fk_col=fk_col)
+        
+        # PRAGMA statements
+        if self.table_names:
+            table = self._get_random_table()
+            yield f"PRAGMA table_info({table});"
+            yield f"PRAGMA index_list({table});"
+            yield f"PRAGMA foreign_key_list({table});"
+        
+        # Additional PRAGMA statements
+        yield from _PRAGMA_SETTING_QUERIES
+        
+        # CREATE TABLE without ROWID
+        no_rowid_table = f"no_rowid_table_{next(suffixes)}"
+        yield _WITHOUT_ROWID_TABLE_TEMPLATE.format(no_rowid_table=no_rowid_table)
+        
+        # CREATE trigger
+        trigger_table = self._get_random_table()
+        trigger_name = f"trg_{trigger_table}_{next(suffixes)}"
+        yield _TRIGGER_TEMPLATE.format(trigger_name=trigger_name, trigger_table=trigger_table)
+        
+        # DROP trigger
+        yield f"DROP TRIGGER IF EXISTS {trigger_name};"
+    
+    def _generate_materialized_queries(self) -> Iterator[str]:
+        """
+        Generate queries with explicit MATERIALIZED and NOT MATERIALIZED hints,
+        along with other advanced SQL features.
+        """
+        n_tables = len(self.table_names)
+        
+        # Examples with explicit MATERIALIZED and NOT MATERIALIZED hints
+        yield from _MATERIALIZATION_HINT_QUERIES
+        
+        # --- Materialization with dynamic data ---
+        
+        # Table shared by the single-table queries below (__init__ guarantees one exists)
+        table = self._get_random_table()
+        pk = self._get_primary_key_column(table)
+        
+        # Get some columns for building dynamic queries
+        cols = self._get_random_columns(table, min_count=2, max_count=3)
+        columns_str = self._join_columns(cols)
+        
+        # CTE with materialization and table data
+        col1 = cols[0]
+        yield _MATERIALIZED_TABLE_CTE_TEMPLATE.format(table=table, pk=pk, col1=col1, columns_str=columns_str)
+        
+        # Multiple CTEs with mixed materialization
+        col2 = cols[1] if len(cols) > 1 else cols[0]
+        
+        yield _MIXED_MATERIALIZATION_CTE_TEMPLATE.format(table=table, pk=pk, col1=col1, col2=col2)
+        
+        # --- Complex materialized queries with functions and expressions ---
+        
+        # JSON, math, date and recursive CTEs with materialization hints
+        yield from _MATERIALIZED_EXPRESSION_QUERIES
+        
+        # --- Combination of materialization with other advanced features ---
+        
+        if n_tables >= 2:
+            table1, table2 = self._get_random_tables(2)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            col1 = self._get_random_column(table1)
+            col2 = self._get_random_column(table2)
+            
+            params = {"table1": table1, "table2": table2, "pk1": pk1, "pk2": pk2, "col1": col1, "col2": col2}
+            
+            # Materialization + Window functions + Join
+            yield _MATERIALIZED_WINDOW_JOIN_TEMPLATE.format_map(params)
+            
+            # Materialization + Subqueries + CASE
+            yield _MATERIALIZED_SUBQUERY_CASE_TEMPLATE.format_map(params)
+        
+        # Advanced nested materialization pattern
+        col = self._get_random_column(table)
+        
+        yield _MATERIALIZED_RECURSIVE_GROUP_TEMPLATE.format(table=table, pk=pk, col=col)
+        
+        # --- Super complex materialized query ---
+        
+        if n_tables >= 3:
+            table1, table2, table3 = self._get_random_tables(3)
+            pk1 = self._get_primary_key_column(table1)
+            pk2 = self._get_primary_key_column(table2)
+            pk3 = self._get_primary_key_column(table3)
+            col1 = self._get_random_column(table1)
+            col2 = self._get_random_column(table2)
+            col3 = self._get_random_column(table3)
+            
+            yield _MATERIALIZED_MULTI_TABLE_TEMPLATE.format(table1=table1, table2=table2, table3=table3, pk1=pk1, pk2=pk2, pk3=pk3, col1=col1, col2=col2, col3=col3)
+    
+    def _generate_nested_queries(self) -> Iterator[str]:
+        """
+        Generate complex nested queries with multiple levels (depth) of nesting.
+        Incorporates various SQL features like subqueries, CTEs, joins, aggregates
+        and window functions at different nesting depths.
+        """
+        # Bind the pickers once instead of resolving them on every call
+        get_random_table = self._get_random_table
+        get_random_tables = self._get_random_tables
+        get_random_column = self._get_random_column
+        pick_distinct_columns = self._pick_distinct_columns
+        get_primary_key_column = self._get_primary_key_column
+        n_tables = len(self.table_names)
+        
+        # --- Simple Nested Subqueries (Level 2) ---
+        for _ in range(2):
+            table = get_random_table()
+            pk = get_primary_key_column(table)
+            
+            # Get two distinct columns
+            col1, col2 = pick_distinct_columns(table, 2)
+            
+            params = {"table": table, "pk": pk, "col1": col1, "col2": col2}
+            
+            # Nested WHERE subquery
+            yield _NESTED_WHERE_SUBQUERY_TEMPLATE.format_map(params)
+            
+            # FROM clause subquery with filtering
+            yield _FILTERED_FROM_SUBQUERY_TEMPLATE.format_map(params)
+        
+        # --- Double Nested Subqueries (Level 3) ---
+        if n_tables >= 2:
+            for _ in range(2):
+                table1, table2 = get_random_tables(2)
+                pk1 = get_primary_key_column(table1)
+                pk2 = get_primary_key_column(table2)
+                col1 = get_random_column(table1)
+                col2 = get_random_column(table2)
+                
+                params = {"table1": table1, "table2": table2, "pk1": pk1, "pk2": pk2, "col1": col1, "col2": col2}
+                
+                # Level 3 nesting with multiple features
+                yield _CORRELATED_COUNT_SUBQUERY_TEMPLATE.format_map(params)
+                
+                # Same result with the correlated subquery memoized per distinct key
+                yield _MEMOIZED_CORRELATED_COUNT_TEMPLATE.format_map(params)
+                
+                # Level 3 nesting with different features
+                yield _NESTED_DERIVED_JOIN_TEMPLATE.format_map(params)
+        
+        # --- Complex WITH Clause and Nested Subqueries (Level 3+) ---
+        if n_tables >= 2:
+            table1, table2 = get_random_tables(2)
+            pk1 = get_primary_key_column(table1)
+            pk2 = get_primary_key_column(table2)
+            col1 = get_random_column(table1)
+            numeric_cols = self._get_column_groups(table1)["numeric"]
+            
+            if numeric_cols:
+                num_col = random.choice(numeric_cols)
+                
+                # WITH clauses + nesting
+                yield _NESTED_AGGREGATE_CTE_TEMPLATE.format(table1=table1, table2=table2, pk1=pk1, pk2=pk2, col1=col1, num_col=num_col)
+        
+        # --- Super Complex Nested Queries (Level 4+) ---
+        if n_tables >= 3:
+            table1, table2, table3 = get_random_tables(3)
+            pk1 = get_primary_key_column(table1)
+            pk2 = get_primary_key_column(table2)
+            pk3 = get_primary_key_column(table3)
+            
+            # Get columns for each table
+            col1 = get_random_column(table1)
+            col2 = get_random_column(table2)
+            col3 = get_random_column(table3)
+            
+            params = {"table1": table1, "table2": table2, "table3": table3,
+                      "pk1": pk1, "pk2": pk2, "pk3": pk3,
+                      "col1": col1, "col2": col2, "col3": col3}
+            
+            # Deeply nested with multiple features
+            yield _RECURSIVE_NESTED_COUNT_TEMPLATE.format_map(params)
+            
+            # Complex nested window functions and aggregates
+            yield _NESTED_WINDOW_AGGREGATE_TEMPLATE.format_map(params)
+        
+        # --- CTE with Deep Nesting and Multiple Features ---
+        if n_tables >= 2:
+            table1, table2 = get_random_tables(2)
+            pk1 = get_primary_key_column(table1)
+            pk2 = get_primary_key_column(table2)
+            
+            # Get distinct columns for table1
+            col1a, col1b = pick_distinct_columns(table1, 2)
+            
+            col2 = get_random_column(table2)
+            
+            # CTE with subquery and window function combinations
+            yield _QUARTILE_CTE_TEMPLATE.format(table1=table1, table2=table2, pk1=pk1, pk2=pk2, col1a=col1a, col1b=col1b, col2=col2)
+        
+        # --- Combine Multiple Techniques in One Query ---
+        table = get_random_table()
+        pk = get_primary_key_column(table)
+        
+        # Get two distinct columns
+        col1, col2 = pick_distinct_columns(table, 2)
+        
+        # Nested UNION, window functions, aggregates, and filtering
+        yield _SEGMENT_UNION_TEMPLATE.format(table=table, pk=pk, col1=col1, col2=col2)
     
\ No newline at end of file